@@ -1,28 +1,38 @@
 """Configuration for the agent system."""
 
+import functools
+import logging
 import os
 import sys
 from pathlib import Path
+from types import MappingProxyType
 from dotenv import load_dotenv
 
-# Add src to path for package imports
-sys.path.insert(0, str(Path(__file__).parent / "src"))
+# Add src to path for package imports (once; main.py and config.py both do this)
+_SRC_DIR = str(Path(__file__).parent / "src")
+if _SRC_DIR not in sys.path:
+    sys.path.insert(0, _SRC_DIR)
+
+# Environment snapshot (.env loaded once, then plain dict lookups)
+_ENV: dict[str, str] | None = None
+
+
+def _bootstrap() -> dict[str, str]:
+    """Load .env (once) and snapshot the process environment."""
+    global _ENV
+    if _ENV is None:
+        load_dotenv()
+        _ENV = dict(os.environ)
+    return _ENV
+
 
 # Load environment variables
-load_dotenv()
+_bootstrap()
 
 # Import from new package structure
 from orchestragent.core.environment import is_running_in_container
 
 
-# Project root
-PROJECT_ROOT = Path(os.getenv("PROJECT_ROOT", ".")).resolve()
-
-# Target project (optional) - this is the host-side path
-TARGET_PROJECT = os.getenv("TARGET_PROJECT", None)
-if TARGET_PROJECT:
-    TARGET_PROJECT = Path(TARGET_PROJECT).resolve()
-
 def _env_or_default(name: str, default: str | None) -> str | None:
     """
     Get environment variable value or default, treating empty string as unset.
@@ -30,16 +40,69 @@ def _env_or_default(name: str, default: str | None) -> str | None:
     This ensures that when docker-compose passes empty env vars like
     PLANNER_MODEL="", we still correctly fall back to LLM_MODEL.
     """
-    value = os.getenv(name, None)
+    value = _ENV.get(name)
     if value is None or value == "":
         return default
     return value
 
 
+def _int_env(name: str, default: int) -> int:
+    """Parse an integer environment variable, falling back to default on bad input."""
+    value = _env_or_default(name, None)
+    if value is None:
+        return default
+    try:
+        return int(value)
+    except ValueError:
+        logging.getLogger(__name__).warning(
+            "Invalid integer for %s: %r (using default %r)", name, value, default
+        )
+        return default
+
+
+def _float_env(name: str, default: float) -> float:
+    """Parse a float environment variable, falling back to default on bad input."""
+    value = _env_or_default(name, None)
+    if value is None:
+        return default
+    try:
+        return float(value)
+    except ValueError:
+        logging.getLogger(__name__).warning(
+            "Invalid number for %s: %r (using default %r)", name, value, default
+        )
+        return default
+
+
+_TRUE_VALUES = frozenset({"true", "1", "yes", "on"})
+
+
+def _bool_env(name: str, default: bool) -> bool:
+    """Parse a boolean environment variable ("true"/"1"/"yes"/"on" are True)."""
+    value = _env_or_default(name, None)
+    if value is None:
+        return default
+    return value.strip().lower() in _TRUE_VALUES
+
+
+@functools.lru_cache(maxsize=None)
+def _resolved(path: str) -> Path:
+    """Resolve a path once (resolve() stats every path component)."""
+    return Path(path).resolve()
+
+
+# Project root
+PROJECT_ROOT = _resolved(_env_or_default("PROJECT_ROOT", "."))
+
+# Target project (optional) - this is the host-side path
+TARGET_PROJECT = _env_or_default("TARGET_PROJECT", None)
+if TARGET_PROJECT:
+    TARGET_PROJECT = _resolved(TARGET_PROJECT)
+
 # LLM Configuration
-LLM_BACKEND = os.getenv("LLM_BACKEND", "cursor_cli")
-LLM_OUTPUT_FORMAT = os.getenv("LLM_OUTPUT_FORMAT", "text")
-LLM_MODEL = os.getenv("LLM_MODEL", None)  # None = use Cursor CLI default
+LLM_BACKEND = _env_or_default("LLM_BACKEND", "cursor_cli")
+LLM_OUTPUT_FORMAT = _env_or_default("LLM_OUTPUT_FORMAT", "text")
+LLM_MODEL = _env_or_default("LLM_MODEL", None)  # None = use Cursor CLI default
 
 # Agent-specific Model Configuration
 # Each agent can have its own default model
@@ -50,14 +113,14 @@ JUDGE_MODEL = _env_or_default("JUDGE_MODEL", LLM_MODEL)
 
 # Dynamic Model Selection for Workers
 # These models are used when dynamic selection is enabled
-WORKER_MODEL_LIGHT = os.getenv("WORKER_MODEL_LIGHT", WORKER_MODEL)  # For simple tasks
-WORKER_MODEL_STANDARD = os.getenv("WORKER_MODEL_STANDARD", WORKER_MODEL)  # For standard tasks
-WORKER_MODEL_POWERFUL = os.getenv("WORKER_MODEL_POWERFUL", WORKER_MODEL)  # For complex tasks
+WORKER_MODEL_LIGHT = _env_or_default("WORKER_MODEL_LIGHT", WORKER_MODEL)  # For simple tasks
+WORKER_MODEL_STANDARD = _env_or_default("WORKER_MODEL_STANDARD", WORKER_MODEL)  # For standard tasks
+WORKER_MODEL_POWERFUL = _env_or_default("WORKER_MODEL_POWERFUL", WORKER_MODEL)  # For complex tasks
 
 # Model Selection Configuration
-MODEL_SELECTION_ENABLED = os.getenv("MODEL_SELECTION_ENABLED", "false").lower() == "true"
-MODEL_COMPLEXITY_THRESHOLD_LIGHT = float(os.getenv("MODEL_COMPLEXITY_THRESHOLD_LIGHT", "10.0"))
-MODEL_COMPLEXITY_THRESHOLD_POWERFUL = float(os.getenv("MODEL_COMPLEXITY_THRESHOLD_POWERFUL", "30.0"))
+MODEL_SELECTION_ENABLED = _bool_env("MODEL_SELECTION_ENABLED", False)
+MODEL_COMPLEXITY_THRESHOLD_LIGHT = _float_env("MODEL_COMPLEXITY_THRESHOLD_LIGHT", 10.0)
+MODEL_COMPLEXITY_THRESHOLD_POWERFUL = _float_env("MODEL_COMPLEXITY_THRESHOLD_POWERFUL", 30.0)
 
 # Agent Configuration
 # Determine working directory:
@@ -69,39 +132,53 @@ if is_running_in_container():
 else:
     # On host, use TARGET_PROJECT if set, otherwise PROJECT_ROOT
     WORKING_DIR = TARGET_PROJECT if TARGET_PROJECT else PROJECT_ROOT
-
-AGENT_CONFIG = {
-    "project_root": str(WORKING_DIR),
-    "project_goal": os.getenv("PROJECT_GOAL", "プロジェクトの目標を設定してください"),
+WORKING_DIR_STR = str(WORKING_DIR)
+
+# Response Cache Configuration
+# Planner / Judge / Plan_Judge (read-only modes) reuse the previous LLM response
+# when the prompt is byte-identical. Worker (agent mode) is never cached.
+RESPONSE_CACHE_ENABLED = _bool_env("RESPONSE_CACHE_ENABLED", True)
+RESPONSE_CACHE_TTL_SECONDS = _float_env("RESPONSE_CACHE_TTL_SECONDS", 0.0)  # 0 = no expiry
+# Also reuse responses for near-duplicate prompts (similarity-based, opt-in)
+SEMANTIC_CACHE_ENABLED = _bool_env("SEMANTIC_CACHE_ENABLED", False)
+
+# Shared base config for all agents (read-only; loop.py layers each agent's
+# overrides over it with a ChainMap, plus a new_child() per parallel worker)
+AGENT_CONFIG = MappingProxyType({
+    "project_root": WORKING_DIR_STR,
+    "project_goal": _env_or_default("PROJECT_GOAL", "プロジェクトの目標を設定してください"),
     "mode": "plan",  # For planner
     "model": LLM_MODEL,
-    "prompt_template": "prompts/planner.md"
-}
+    "prompt_template": "prompts/planner.md",
+    "response_cache": RESPONSE_CACHE_ENABLED,
+    "response_cache_ttl": RESPONSE_CACHE_TTL_SECONDS or None,
+    "semantic_cache": SEMANTIC_CACHE_ENABLED,
+})
 
 # State Configuration
-STATE_DIR = os.getenv("STATE_DIR", "state")
+STATE_DIR = _env_or_default("STATE_DIR", "state")
 
 # ADR (Architecture Decision Records) Configuration
-ADR_DIR = os.getenv("ADR_DIR", "docs/adr")
+ADR_DIR = _env_or_default("ADR_DIR", "docs/adr")
 
 # Logging Configuration
-LOG_DIR = os.getenv("LOG_DIR", "logs")
-LOG_LEVEL = os.getenv("LOG_LEVEL", "INFO")
-LOG_FSYNC = os.getenv("LOG_FSYNC", "false").lower() == "true"
+LOG_DIR = _env_or_default("LOG_DIR", "logs")
+LOG_LEVEL = _env_or_default("LOG_LEVEL", "INFO")
+LOG_FSYNC = _bool_env("LOG_FSYNC", False)
 
 # Main Loop Configuration
-WAIT_TIME_SECONDS = int(os.getenv("WAIT_TIME_SECONDS", "60"))  # Wait time between agent runs (in seconds)
-MAX_ITERATIONS = int(os.getenv("MAX_ITERATIONS", "100"))  # Maximum iterations
+WAIT_TIME_SECONDS = _int_env("WAIT_TIME_SECONDS", 60)  # Wait time between agent runs (in seconds)
+MAX_ITERATIONS = _int_env("MAX_ITERATIONS", 100)  # Maximum iterations
 
 # Error Handling Configuration
-MAX_RETRIES = int(os.getenv("MAX_RETRIES", "3"))  # Maximum retries for retryable errors
+MAX_RETRIES = _int_env("MAX_RETRIES", 3)  # Maximum retries for retryable errors
 
 # Parallel Execution Configuration
-MAX_PARALLEL_WORKERS = int(os.getenv("MAX_PARALLEL_WORKERS", "3"))  # Maximum parallel workers
-ENABLE_PARALLEL_EXECUTION = os.getenv("ENABLE_PARALLEL_EXECUTION", "true").lower() == "true"  # Enable parallel execution
+MAX_PARALLEL_WORKERS = _int_env("MAX_PARALLEL_WORKERS", 3)  # Maximum parallel workers
+ENABLE_PARALLEL_EXECUTION = _bool_env("ENABLE_PARALLEL_EXECUTION", True)  # Enable parallel execution
 
 # Planning Review Configuration
 # 1イテレーション内で Planner ↔ Plan_Judge を何回まで往復するかの最大回数。
 # この回数を超えても Plan_Judge が「revise」を返す場合は、計画の収束に失敗したとみなし、
 # イテレーション数が残っていてもエージェントシステム全体を失敗として終了させる。
-MAX_PLAN_REVISIONS = int(os.getenv("MAX_PLAN_REVISIONS", "3"))
+MAX_PLAN_REVISIONS = _int_env("MAX_PLAN_REVISIONS", 3)
@@ -4,8 +4,10 @@ import sys
 import argparse
 from pathlib import Path
 
-# Add src to path for package imports
-sys.path.insert(0, str(Path(__file__).parent / "src"))
+# Add src to path for package imports (once; main.py and config.py both do this)
+_SRC_DIR = str(Path(__file__).parent / "src")
+if _SRC_DIR not in sys.path:
+    sys.path.insert(0, _SRC_DIR)
 
 
 def main():
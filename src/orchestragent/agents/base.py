@@ -1,24 +1,53 @@
 """Base agent class."""
 
+import hashlib
+import random
+import threading
 import time
-from typing import Dict, Any, Optional
+from collections import OrderedDict
+from typing import Dict, Any, MutableMapping, Optional, Tuple
 
 from orchestragent.llm.client import LLMClient
+from orchestragent.llm.semantic_cache import SemanticCache, DEFAULT_THRESHOLDS
 from orchestragent.state.manager import StateManager
 from orchestragent.core.logger import AgentLogger
+from orchestragent.core.timeutil import now_iso
 from orchestragent.core.exceptions import AgentError, LLMError
+from orchestragent.models import Task
+
+# Upper bound for the exponential part of the retry backoff
+_MAX_BACKOFF_SECONDS = 30
+
+# Start of the state-dependent part of the prompt templates; the static
+# instructions before it would dominate the semantic cache similarity
+_STATE_SECTION_MARKER = "## 現在の状況"
 
 
 class BaseAgent:
     """Base class for all agents."""
 
+    # Process-wide LLM response cache shared by all agents.
+    # key -> (stored_at (monotonic), response)
+    _RESPONSE_CACHE: "OrderedDict[str, Tuple[float, str]]" = OrderedDict()
+    _RESPONSE_CACHE_MAXSIZE = 512
+    _response_cache_lock = threading.Lock()
+    _response_cache_hits = 0
+    _response_cache_misses = 0
+
+    # Near-duplicate prompt cache (opt-in via "semantic_cache" config)
+    _SEMANTIC_CACHE = SemanticCache()
+
+    # Serializes update_state() across agents running concurrently
+    # (status updates are read-modify-write on shared state files)
+    _state_write_lock = threading.Lock()
+
     def __init__(
         self,
         name: str,
         llm_client: LLMClient,
         state_manager: StateManager,
         logger: AgentLogger,
-        config: Optional[Dict[str, Any]] = None
+        config: Optional[MutableMapping[str, Any]] = None
     ):
         """
         Initialize base agent.
@@ -36,6 +65,8 @@ class BaseAgent:
         self.logger = logger
         self.config = config or {}
         self.mode = self.config.get("mode", "agent")
+        # Iteration of the previous run (detects re-runs within an iteration)
+        self._last_run_iteration: Optional[int] = None
 
     def build_prompt(self, state: Dict[str, Any]) -> str:
         """
@@ -90,43 +121,66 @@ class BaseAgent:
         for attempt in range(max_retries):
             try:
                 return self._run_internal(iteration, start_time)
-            except LLMError as e:
-                if e.retryable and attempt < max_retries - 1:
-                    wait_time = 2 ** attempt  # Exponential backoff: 1s, 2s, 4s, ...
-                    self.logger.warning(
-                        f"[{self.name}] LLM error (attempt {attempt + 1}/{max_retries}), "
-                        f"retrying in {wait_time} seconds: {e}"
-                    )
-                    time.sleep(wait_time)
-                    continue
-                # Not retryable or max retries reached
-                self.logger.log_error_with_traceback(
-                    self.name,
-                    e,
-                    context={
-                        "iteration": iteration,
-                        "attempt": attempt + 1,
-                        "max_retries": max_retries
-                    }
-                )
-                raise
-            except AgentError as e:
-                # Other agent errors are not retryable
-                self.logger.log_error_with_traceback(
-                    self.name,
-                    e,
-                    context={"iteration": iteration}
-                )
-                raise
             except Exception as e:
-                # Unexpected errors
-                self.logger.log_error_with_traceback(
-                    self.name,
-                    e,
-                    context={"iteration": iteration}
+                wait_time = self._handle_run_error(e, iteration, attempt, max_retries)
+                time.sleep(wait_time)
+
+    def _handle_run_error(
+        self,
+        error: Exception,
+        iteration: int,
+        attempt: int,
+        max_retries: int
+    ) -> float:
+        """
+        Decide whether a failed attempt is retried.
+
+        Args:
+            error: Exception raised by the attempt
+            iteration: Current iteration number
+            attempt: Zero-based attempt number
+            max_retries: Maximum number of retries
+
+        Returns:
+            Seconds to wait before the next attempt
+
+        Raises:
+            AgentError: If the error is not retryable or retries are exhausted
+        """
+        if isinstance(error, LLMError):
+            if error.retryable and attempt < max_retries - 1:
+                # Exponential backoff (1s, 2s, 4s, ... capped) with jitter so that
+                # agents hitting the same rate limit do not retry in lockstep
+                wait_time = min(2 ** attempt, _MAX_BACKOFF_SECONDS) * random.uniform(0.5, 1.5)
+                # Honor the provider's own rate limit signal when available
+                wait_time = max(wait_time, getattr(error, "retry_after", None) or 0)
+                self.logger.warning(
+                    f"[{self.name}] LLM error (attempt {attempt + 1}/{max_retries}), "
+                    f"retrying in {wait_time:.1f} seconds: {error}"
                 )
-                # Wrap in AgentError
-                raise AgentError(f"Unexpected error: {e}", retryable=False, original_error=e)
+                return wait_time
+            # Not retryable or max retries reached
+            self.logger.log_error_with_traceback(
+                self.name,
+                error,
+                context={
+                    "iteration": iteration,
+                    "attempt": attempt + 1,
+                    "max_retries": max_retries
+                }
+            )
+            raise error
+
+        # Other agent errors are not retryable
+        self.logger.log_error_with_traceback(
+            self.name,
+            error,
+            context={"iteration": iteration}
+        )
+        if isinstance(error, AgentError):
+            raise error
+        # Unexpected errors: wrap in AgentError
+        raise AgentError(f"Unexpected error: {error}", retryable=False, original_error=error)
 
     def _run_internal(self, iteration: int, start_time: float) -> Dict[str, Any]:
         """
@@ -152,13 +206,33 @@ class BaseAgent:
             f"[{self.name}] Starting run "
             f"(mode={self.mode}, model={current_model}, iteration={iteration})"
         )
-        response = self.llm_client.call_agent(
-            prompt=prompt,
-            mode=self.mode,
-            model=self.config.get("model"),
-            agent_name=self.name,
-            logger=self.logger
-        )
+        cache_key = self._response_cache_key(prompt)
+        # A re-run within the same iteration (e.g. the Planner <-> Plan_Judge
+        # revise loop) asks for a fresh evaluation: never replay a response then
+        rerun = iteration == self._last_run_iteration
+        self._last_run_iteration = iteration
+        response = None
+        if cache_key and not rerun:
+            response = self._get_cached_response(cache_key)
+            if response is None:
+                response = self._get_similar_response(prompt)
+        cached = response is not None
+        if not cached:
+            response = self.llm_client.call_agent(
+                prompt=prompt,
+                mode=self.mode,
+                model=self.config.get("model"),
+                agent_name=self.name,
+                logger=self.logger
+            )
+            if cache_key:
+                self._store_cached_response(cache_key, response)
+                if self.config.get("semantic_cache"):
+                    BaseAgent._SEMANTIC_CACHE.insert(
+                        self._semantic_cache_text(prompt),
+                        response,
+                        namespace=self._semantic_cache_namespace()
+                    )
 
         # 4. Parse response
         try:
@@ -176,7 +250,8 @@ class BaseAgent:
 
         # 5. Update state
         try:
-            self.update_state(result)
+            with BaseAgent._state_write_lock:
+                self.update_state(result)
         except Exception as e:
             self.logger.error(f"[{self.name}] Error updating state: {e}")
             raise
@@ -190,11 +265,137 @@ class BaseAgent:
             response=response,
             duration=duration,
             mode=self.mode,
-            model=self.config.get("model")
+            model=self.config.get("model"),
+            cached=cached
         )
 
         return result
 
+    def _response_cache_key(self, prompt: str) -> Optional[str]:
+        """
+        Build response cache key for the prompt.
+
+        Only read-only modes ("plan", "ask") are cached: in "agent" mode the
+        LLM call itself edits the working tree, so replaying a response would
+        silently skip the work. Non-zero temperature also disables caching.
+
+        Args:
+            prompt: Prompt string
+
+        Returns:
+            Cache key, or None if the response must not be cached
+        """
+        if not self.config.get("response_cache", True):
+            return None
+        if self.mode == "agent":
+            return None
+        if self.config.get("temperature"):
+            return None
+
+        model = self.config.get("model") or ""
+        raw = f"{self.mode}|{model}|{prompt}".encode("utf-8")
+        return hashlib.blake2b(raw, digest_size=16).hexdigest()
+
+    def _get_cached_response(self, key: str) -> Optional[str]:
+        """Look up a cached response, honoring LRU order and TTL."""
+        ttl = self.config.get("response_cache_ttl")
+        cls = BaseAgent
+        with cls._response_cache_lock:
+            entry = cls._RESPONSE_CACHE.get(key)
+            if entry is not None and ttl and time.monotonic() - entry[0] > ttl:
+                del cls._RESPONSE_CACHE[key]
+                entry = None
+            if entry is None:
+                cls._response_cache_misses += 1
+                return None
+            cls._RESPONSE_CACHE.move_to_end(key)
+            cls._response_cache_hits += 1
+            hits, misses = cls._response_cache_hits, cls._response_cache_misses
+
+        self.logger.info(
+            f"[{self.name}] Response cache hit (hits={hits}, misses={misses})"
+        )
+        return entry[1]
+
+    def _store_cached_response(self, key: str, response: str) -> None:
+        """Store a response in the cache, evicting the least recently used entry."""
+        cls = BaseAgent
+        with cls._response_cache_lock:
+            cls._RESPONSE_CACHE[key] = (time.monotonic(), response)
+            cls._RESPONSE_CACHE.move_to_end(key)
+            while len(cls._RESPONSE_CACHE) > cls._RESPONSE_CACHE_MAXSIZE:
+                cls._RESPONSE_CACHE.popitem(last=False)
+
+    def _semantic_cache_namespace(self) -> Tuple[str, str, str]:
+        """Namespace that keeps semantic cache entries per agent/mode/model."""
+        return (self.name, self.mode, self.config.get("model") or "")
+
+    @staticmethod
+    def _semantic_cache_text(prompt: str) -> str:
+        """Part of the prompt compared by the semantic cache (the state section)."""
+        start = prompt.find(_STATE_SECTION_MARKER)
+        return prompt[start:] if start >= 0 else prompt
+
+    def _get_similar_response(self, prompt: str) -> Optional[str]:
+        """Look up a response for a near-duplicate prompt (semantic cache)."""
+        if not self.config.get("semantic_cache"):
+            return None
+
+        threshold = self.config.get("semantic_cache_threshold")
+        if threshold is None:
+            threshold = DEFAULT_THRESHOLDS.get(self.mode)
+        if threshold is None:
+            return None
+
+        hit = BaseAgent._SEMANTIC_CACHE.lookup(
+            self._semantic_cache_text(prompt),
+            threshold,
+            namespace=self._semantic_cache_namespace()
+        )
+        if hit is None:
+            return None
+
+        response, similarity = hit
+        self.logger.info(
+            f"[{self.name}] Semantic cache hit (similarity={similarity:.3f})"
+        )
+        return response
+
+    @classmethod
+    def response_cache_stats(cls) -> Dict[str, int]:
+        """
+        Get response cache statistics.
+
+        Returns:
+            Dictionary with hits, misses and current size
+        """
+        with cls._response_cache_lock:
+            return {
+                "hits": cls._response_cache_hits,
+                "misses": cls._response_cache_misses,
+                "size": len(cls._RESPONSE_CACHE),
+            }
+
+    def _get_tasks_by_id(self) -> Dict[str, Task]:
+        """
+        Load all tasks from individual task files in one bulk call.
+
+        Used instead of calling get_task_by_id() once per index entry.
+
+        Returns:
+            Dictionary mapping task ID to Task (empty if tasks cannot be loaded)
+        """
+        try:
+            tasks = self.state_manager.get_all_tasks_from_files()
+        except Exception as e:
+            self.logger.warning(f"[{self.name}] Failed to load task files: {e}")
+            return {}
+        return {task.id: task for task in tasks}
+
+    def _get_timestamp(self) -> str:
+        """Get current timestamp."""
+        return now_iso()
+
     def load_state(self) -> Dict[str, Any]:
         """
         Load current state.
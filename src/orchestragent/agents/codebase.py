@@ -0,0 +1,84 @@
+"""Codebase summary shared by Planner and Plan_Judge prompts."""
+
+import os
+from pathlib import Path
+from typing import Iterator, Optional
+
+# Number of files listed in the summary
+_MAX_LISTED_FILES = 20
+
+# Directories that never contain project sources worth summarizing
+_SKIP_DIRS = frozenset({
+    '.git', '__pycache__', 'node_modules', '.venv', 'venv', 'build', 'dist',
+})
+
+
+def _iter_py_files(root: str, limit: Optional[int] = None) -> Iterator[str]:
+    """
+    Iterate Python file paths under root.
+
+    Stack-based os.scandir walk that skips _SKIP_DIRS and does not follow
+    symlinked directories. Yields plain path strings lazily and stops
+    scanning as soon as limit files have been found.
+
+    Args:
+        root: Root directory
+        limit: Maximum number of files to yield (None for no limit)
+
+    Yields:
+        Path of each .py file
+    """
+    if limit is not None and limit <= 0:
+        return
+    found = 0
+    stack = [root]
+    while stack:
+        try:
+            it = os.scandir(stack.pop())
+        except OSError:
+            continue
+        with it:
+            for entry in it:
+                try:
+                    if entry.is_dir(follow_symlinks=False):
+                        if entry.name not in _SKIP_DIRS:
+                            stack.append(entry.path)
+                    elif entry.name.endswith('.py'):
+                        yield entry.path
+                        found += 1
+                        if limit is not None and found >= limit:
+                            return
+                except OSError:
+                    continue
+
+
+def _build_codebase_summary(project_root: Path) -> str:
+    """Build codebase summary (list Python files)."""
+    root = str(project_root)
+    # Only need to know whether there are more than _MAX_LISTED_FILES files
+    python_files = list(_iter_py_files(root, limit=_MAX_LISTED_FILES + 1))
+
+    if len(python_files) > _MAX_LISTED_FILES:
+        return f"コードベースには {_MAX_LISTED_FILES} 個以上のPythonファイルがあります。"
+    # Walked paths are os.path.join(root, ...), so the relative path is a plain
+    # string slice (no relpath/PurePath work per file)
+    prefix_len = len(os.path.join(root, ''))
+    file_list = "\n".join([f"- {f[prefix_len:]}" for f in python_files])
+    return f"主要なファイル:\n{file_list}"
+
+
+def get_codebase_summary(project_root: str = ".") -> str:
+    """
+    Get codebase summary.
+
+    Built on every call: the bounded walk stops after _MAX_LISTED_FILES + 1
+    files, and any cheaper change signature would miss edits in nested
+    directories.
+
+    Args:
+        project_root: Project root directory
+
+    Returns:
+        Summary string for prompts
+    """
+    return _build_codebase_summary(Path(project_root))
@@ -1,11 +1,30 @@
 """Judge agent implementation."""
 
-import json
-import re
-from typing import Dict, Any
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Any, List, Optional
 
 from .base import BaseAgent
-from orchestragent.models import Task
+from .parsing import parse_llm_json
+from .templates import load_template, render_template
+from orchestragent.models import Task, TaskStatus
+
+# Shared pool for reading completed task result files (I/O-bound)
+_result_read_executor = ThreadPoolExecutor(max_workers=8, thread_name_prefix="judge-read")
+_PARALLEL_READ_MIN_FILES = 2
+
+
+# Fallback prompt used when the template file is missing
+# Static instructions first, per-iteration state last (stable prompt prefix)
+_FALLBACK_JUDGE_TEMPLATE = """# Judge Agent
+
+Project Goal: {project_goal}
+
+Please evaluate progress and decide whether to continue.
+
+Current Plan: {current_plan}
+Tasks: {total_tasks} total, {completed_tasks} completed, {pending_tasks} pending
+"""
 
 
 class JudgeAgent(BaseAgent):
@@ -24,46 +43,36 @@ class JudgeAgent(BaseAgent):
             "prompts/judge.md"
         )
 
-        try:
-            with open(prompt_template_path, 'r', encoding='utf-8') as f:
-                template = f.read()
-        except FileNotFoundError:
-            # Fallback to simple prompt
-            template = """# Judge Agent
+        template = load_template(prompt_template_path, fallback=_FALLBACK_JUDGE_TEMPLATE)
 
-Project Goal: {project_goal}
-Current Plan: {current_plan}
-Tasks: {total_tasks} total, {completed_tasks} completed, {pending_tasks} pending
-
-Please evaluate progress and decide whether to continue.
-"""
-
-        # Get task statistics from individual task files (source of truth)
-        task_stats = self.state_manager.get_task_statistics()
-        total_tasks = task_stats.total
-        completed_tasks = task_stats.completed
-        failed_tasks = task_stats.failed
-        pending_tasks = task_stats.pending
-
-        # Get all tasks from individual files to get completed task results
+        # Get all tasks from individual files (source of truth) and derive both
+        # the statistics and the completed tasks with result files in one pass
         all_tasks = self.state_manager.get_all_tasks_from_files()
-
-        # Get completed task results
-        completed_results = []
+        statuses = Counter()
+        completed = []
         for task in all_tasks:
-            if task.is_completed():
-                result_file = task.result_file
-                if result_file:
-                    try:
-                        result_content = self.state_manager.load_text(result_file)
-                        completed_results.append(f"### {task.id}: {task.title}\n{result_content[:200]}...")
-                    except:
-                        pass
+            statuses[task.status] += 1
+            if task.is_completed() and task.result_file:
+                completed.append(task)
+
+        total_tasks = len(all_tasks)
+        completed_tasks = statuses[TaskStatus.COMPLETED]
+        failed_tasks = statuses[TaskStatus.FAILED]
+        pending_tasks = statuses[TaskStatus.PENDING]
+
+        # Get completed task results (result files are read in parallel)
+        result_contents = self._load_result_files([task.result_file for task in completed])
+        completed_results = [
+            f"### {task.id}: {task.title}\n{content[:200]}..."
+            for task, content in zip(completed, result_contents)
+            if content is not None
+        ]
 
         completed_results_str = "\n\n".join(completed_results) if completed_results else "完了したタスクはありません"
 
         # Format template
-        prompt = template.format(
+        prompt = render_template(
+            template,
             project_goal=self.config.get("project_goal", "未設定"),
             current_plan=state.get("plan", "計画はまだ作成されていません"),
             total_tasks=total_tasks,
@@ -76,20 +85,35 @@ Please evaluate progress and decide whether to continue.
 
         return prompt
 
-    def parse_response(self, response: str) -> Dict[str, Any]:
-        """Parse judge response."""
-        # Try to extract JSON from response
+    def _load_result_file(self, result_file: str) -> Optional[str]:
+        """Load a task result file, returning None if it cannot be read."""
         try:
-            # Look for JSON code block
-            json_match = re.search(r'```json\n(.*?)\n```', response, re.DOTALL)
-            if json_match:
-                return json.loads(json_match.group(1))
+            return self.state_manager.load_text(result_file)
+        except Exception:
+            return None
 
-            # Try to find JSON object directly
-            json_match = re.search(r'\{.*\}', response, re.DOTALL)
-            if json_match:
-                return json.loads(json_match.group(0))
+    def _load_result_files(self, result_files: List[str]) -> List[Optional[str]]:
+        """
+        Load task result files.
 
+        Args:
+            result_files: Result file paths
+
+        Returns:
+            File contents in the same order (None for unreadable files)
+        """
+        # Thread dispatch costs more than it saves for a couple of files
+        if len(result_files) <= _PARALLEL_READ_MIN_FILES:
+            return [self._load_result_file(f) for f in result_files]
+        return list(_result_read_executor.map(self._load_result_file, result_files))
+
+    def parse_response(self, response: str) -> Dict[str, Any]:
+        """Parse judge response."""
+        return parse_llm_json(response, lambda error: self._fallback_result(response, error))
+
+    def _fallback_result(self, response: str, error: Optional[Exception]) -> Dict[str, Any]:
+        """Build judge result when the response contains no valid JSON."""
+        if error is None:
             # If no JSON found, try to extract key information
             should_continue = "継続" in response or "continue" in response.lower() or "true" in response.lower()
             return {
@@ -100,18 +124,17 @@ Please evaluate progress and decide whether to continue.
                 "recommendations": [],
                 "next_iteration_focus": "JSON形式で出力されませんでした"
             }
-        except json.JSONDecodeError as e:
-            self.logger.warning(f"[Judge] Failed to parse JSON: {e}")
-            # Fallback: extract from text
-            should_continue = "継続" in response or "continue" in response.lower()
-            return {
-                "should_continue": should_continue,
-                "reason": f"JSON解析エラー: {e}. レスポンス: {response[:500]}",
-                "progress_score": 0.5,
-                "drift_detected": False,
-                "recommendations": [],
-                "next_iteration_focus": "JSON形式で出力してください"
-            }
+        self.logger.warning(f"[Judge] Failed to parse JSON: {error}")
+        # Fallback: extract from text
+        should_continue = "継続" in response or "continue" in response.lower()
+        return {
+            "should_continue": should_continue,
+            "reason": f"JSON解析エラー: {error}. レスポンス: {response[:500]}",
+            "progress_score": 0.5,
+            "drift_detected": False,
+            "recommendations": [],
+            "next_iteration_focus": "JSON形式で出力してください"
+        }
 
     def update_state(self, result: Dict[str, Any]) -> None:
         """Update state with judge result."""
@@ -134,8 +157,3 @@ Please evaluate progress and decide whether to continue.
 
         if drift_detected:
             self.logger.warning(f"[Judge] Drift detected: {result.get('drift_description', 'N/A')}")
-
-    def _get_timestamp(self) -> str:
-        """Get current timestamp."""
-        from datetime import datetime
-        return datetime.now().isoformat()
@@ -0,0 +1,142 @@
+"""JSON extraction helpers for agent responses."""
+
+import json
+import re
+from typing import Any, Callable, Dict, Iterator, Optional
+
+# orjson is optional: faster decoding for large responses when installed
+try:
+    import orjson
+
+    _loads = orjson.loads
+    JSONDecodeError = (json.JSONDecodeError, orjson.JSONDecodeError)
+except ImportError:
+    _loads = json.loads
+    JSONDecodeError = (json.JSONDecodeError,)
+
+# json5 is optional: lenient second chance (trailing commas, comments, single
+# quotes) used only when strict decoding fails
+try:
+    import json5
+except ImportError:
+    json5 = None
+
+# ```json ... ``` fenced code block
+_JSON_BLOCK_RE = re.compile(r'```json\s*\n(.*?)\n```', re.DOTALL)
+
+# Upper bound on '{' positions tried when scanning a response for JSON
+_MAX_JSON_CANDIDATES = 8
+
+
+def _match_brace(text: str, start: int) -> int:
+    """
+    Find the brace closing the object that opens at text[start].
+
+    Single pass that tracks brace depth and string literals (including
+    escaped quotes), so braces inside strings are ignored. No backtracking.
+
+    Returns:
+        Index of the closing brace, or -1 if the object is not balanced
+    """
+    depth = 0
+    in_string = False
+    escaped = False
+    for i in range(start, len(text)):
+        ch = text[i]
+        if in_string:
+            if escaped:
+                escaped = False
+            elif ch == '\\':
+                escaped = True
+            elif ch == '"':
+                in_string = False
+        elif ch == '"':
+            in_string = True
+        elif ch == '{':
+            depth += 1
+        elif ch == '}':
+            depth -= 1
+            if depth == 0:
+                return i
+    return -1
+
+
+def iter_json_candidates(text: str, limit: int = _MAX_JSON_CANDIDATES) -> Iterator[str]:
+    """
+    Iterate balanced {...} substrings in order of appearance.
+
+    A stray unbalanced '{' (e.g. in prose before the JSON) is skipped rather
+    than ending the search. The number of candidates is bounded, so the
+    worst case stays linear in the text length.
+
+    Args:
+        text: Text that may contain JSON objects
+        limit: Maximum number of opening braces to try
+
+    Yields:
+        Candidate JSON object substrings
+    """
+    pos = 0
+    for _ in range(limit):
+        start = text.find('{', pos)
+        if start == -1:
+            return
+        end = _match_brace(text, start)
+        if end == -1:
+            pos = start + 1
+            continue
+        yield text[start:end + 1]
+        pos = end + 1
+
+
+def parse_llm_json(
+    response: str,
+    fallback: Callable[[Optional[Exception]], Dict[str, Any]]
+) -> Dict[str, Any]:
+    """
+    Extract a JSON object from an LLM response.
+
+    Tries the whole response as JSON first, then a ```json fenced block,
+    then balanced JSON objects in order of appearance.
+    If strict decoding fails and json5 is installed, it is retried leniently.
+
+    Args:
+        response: LLM response string
+        fallback: Builds the result when no JSON could be parsed. Called with
+            None if no JSON was found, or with the decode error otherwise.
+
+    Returns:
+        Parsed JSON object, or the fallback result
+    """
+    # Fast path: the whole response is a JSON object, no scanning needed
+    stripped = response.strip()
+    if stripped.startswith('{') and stripped.endswith('}'):
+        try:
+            return _loads(stripped)
+        except JSONDecodeError:
+            pass
+
+    json_match = _JSON_BLOCK_RE.search(response)
+    if json_match:
+        candidates = [json_match.group(1)]
+    else:
+        candidates = list(iter_json_candidates(response))
+        if not candidates:
+            return fallback(None)
+
+    first_error: Optional[Exception] = None
+    for json_text in candidates:
+        try:
+            result = _loads(json_text)
+            break
+        except JSONDecodeError as e:
+            first_error = first_error or e
+    else:
+        if json5 is None:
+            return fallback(first_error)
+        try:
+            result = json5.loads(candidates[0])
+        except ValueError:
+            return fallback(first_error)
+
+    return result
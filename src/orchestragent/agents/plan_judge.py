@@ -1,13 +1,28 @@
 """Plan judge agent implementation."""
 
-import json
-import re
-from typing import Dict, Any
+from typing import Dict, Any, Optional
 
 from .base import BaseAgent
+from .codebase import get_codebase_summary
+from .parsing import parse_llm_json
+from .templates import load_template, render_template, template_fields
 from orchestragent.models import Task
 
 
+# Fallback prompt used when the template file is missing
+# Static instructions first, per-iteration state last (stable prompt prefix)
+_FALLBACK_PLAN_JUDGE_TEMPLATE = """# Plan Judge Agent
+
+Project Goal: {project_goal}
+
+Please evaluate whether this plan and task list are appropriate.
+
+Current Plan: {current_plan}
+Tasks Summary:
+{tasks_summary}
+"""
+
+
 class PlanJudgeAgent(BaseAgent):
     """Agent that evaluates the current plan and task list."""
 
@@ -25,20 +40,7 @@ class PlanJudgeAgent(BaseAgent):
             "prompts/plan_judge.md",
         )
 
-        try:
-            with open(prompt_template_path, "r", encoding="utf-8") as f:
-                template = f.read()
-        except FileNotFoundError:
-            # Fallback to simple prompt
-            template = """# Plan Judge Agent
-
-Project Goal: {project_goal}
-Current Plan: {current_plan}
-Tasks Summary:
-{tasks_summary}
-
-Please evaluate whether this plan and task list are appropriate.
-"""
+        template = load_template(prompt_template_path, fallback=_FALLBACK_PLAN_JUDGE_TEMPLATE)
 
         plan = state.get("plan", "")
         tasks = state.get("tasks", {})
@@ -49,14 +51,12 @@ Please evaluate whether this plan and task list are appropriate.
         tasks_summary = ""
         if tasks_list:
             lines = []
+            tasks_by_id = self._get_tasks_by_id()
             for task_index in tasks_list:
                 task_id = task_index.get("id", "unknown")
                 title = task_index.get("title", "No title")
                 # Plan_Judge は index 情報だけで十分なため、status は index ではなく個別ファイルから取得
-                try:
-                    task = self.state_manager.get_task_by_id(task_id)
-                except Exception:
-                    task = None
+                task = tasks_by_id.get(task_id)
                 if task:
                     task_status = task.status.value
                     priority = task.priority.value
@@ -72,11 +72,15 @@ Please evaluate whether this plan and task list are appropriate.
 
         working_dir = self.config.get("project_root", ".")
 
-        prompt = template.format(
+        prompt = render_template(
+            template,
             project_goal=self.config.get("project_goal", "未設定"),
             current_plan=plan if plan else "計画はまだ作成されていません",
             tasks_summary=tasks_summary,
-            codebase_summary=self._get_codebase_summary(),
+            codebase_summary=(
+                self._get_codebase_summary()
+                if "codebase_summary" in template_fields(template) else ""
+            ),
             iteration=status.get("current_iteration", 0),
             working_dir=working_dir,
         )
@@ -85,31 +89,15 @@ Please evaluate whether this plan and task list are appropriate.
 
     def _get_codebase_summary(self) -> str:
         """Get codebase summary."""
-        from pathlib import Path
-
-        project_root = Path(self.config.get("project_root", "."))
-        python_files = list(project_root.glob("**/*.py"))
-
-        if len(python_files) > 20:
-            return f"コードベースには {len(python_files)} 個以上のPythonファイルがあります。"
-        file_list = "\n".join(
-            [f"- {f.relative_to(project_root)}" for f in python_files[:20]]
-        )
-        return f"主要なファイル:\n{file_list}"
+        return get_codebase_summary(self.config.get("project_root", "."))
 
     def parse_response(self, response: str) -> Dict[str, Any]:
         """Parse plan judge response."""
-        try:
-            # Look for JSON code block
-            json_match = re.search(r"```json\n(.*?)\n```", response, re.DOTALL)
-            if json_match:
-                return json.loads(json_match.group(1))
-
-            # Try to find JSON object directly
-            json_match = re.search(r"\{.*\}", response, re.DOTALL)
-            if json_match:
-                return json.loads(json_match.group(0))
+        return parse_llm_json(response, lambda error: self._fallback_result(response, error))
 
+    def _fallback_result(self, response: str, error: Optional[Exception]) -> Dict[str, Any]:
+        """Build plan judge result when the response contains no valid JSON."""
+        if error is None:
             # Fallback: treat as free-form feedback, default to accept
             return {
                 "decision": "accept",
@@ -117,14 +105,13 @@ Please evaluate whether this plan and task list are appropriate.
                 "issues": [],
                 "suggested_changes": response[:500],
             }
-        except json.JSONDecodeError as e:
-            self.logger.warning(f"[Plan_Judge] Failed to parse JSON: {e}")
-            return {
-                "decision": "accept",
-                "score": 0.5,
-                "issues": [],
-                "suggested_changes": f"JSON解析エラー: {e}. レスポンス: {response[:500]}",
-            }
+        self.logger.warning(f"[Plan_Judge] Failed to parse JSON: {error}")
+        return {
+            "decision": "accept",
+            "score": 0.5,
+            "issues": [],
+            "suggested_changes": f"JSON解析エラー: {error}. レスポンス: {response[:500]}",
+        }
 
     def update_state(self, result: Dict[str, Any]) -> None:
         """Update state with plan judge result."""
@@ -143,9 +130,3 @@ Please evaluate whether this plan and task list are appropriate.
             f"[Plan_Judge] Decision: {decision}, score: {score}, "
             f"issues: {len(result.get('issues', []))}"
         )
-
-    def _get_timestamp(self) -> str:
-        """Get current timestamp."""
-        from datetime import datetime
-
-        return datetime.now().isoformat()
@@ -2,11 +2,33 @@
 
 import json
 import re
-from typing import Dict, Any
+from typing import Dict, Any, Optional
 
 from .base import BaseAgent
+from .codebase import get_codebase_summary
+from .parsing import parse_llm_json
+from .templates import load_template, render_template, template_fields
 from orchestragent.models import Task
 
+# File mentions in task descriptions: explicit ("file: src/main.py", group 1) or
+# quoted ("`src/my file.py`", group 2; may contain spaces), matched in a single pass
+_FILES_COMBINED_RE = re.compile(
+    r'file:\s*([^\s"\'`]+\.(?:py|ts|json|js|md|yml|yaml|txt|html|css))\b'
+    r'|["\'`]([^"\'`]+\.(?:py|ts|json|js|md|yml|yaml|txt|html|css))["\'`]',
+    re.IGNORECASE
+)
+
+
+# Fallback prompt used when the template file is missing
+_FALLBACK_PLANNER_TEMPLATE = """# Planner Agent
+
+Project Goal: {project_goal}
+Current Plan: {current_plan}
+Existing Tasks: {existing_tasks}
+
+Please create a plan and new tasks in JSON format.
+"""
+
 
 class PlannerAgent(BaseAgent):
     """Agent that creates tasks and updates plans."""
@@ -24,19 +46,7 @@ class PlannerAgent(BaseAgent):
             "prompts/planner.md"
         )
 
-        try:
-            with open(prompt_template_path, 'r', encoding='utf-8') as f:
-                template = f.read()
-        except FileNotFoundError:
-            # Fallback to simple prompt
-            template = """# Planner Agent
-
-Project Goal: {project_goal}
-Current Plan: {current_plan}
-Existing Tasks: {existing_tasks}
-
-Please create a plan and new tasks in JSON format.
-"""
+        template = load_template(prompt_template_path, fallback=_FALLBACK_PLANNER_TEMPLATE)
 
         # Format template
         plan = state.get("plan", "")
@@ -48,10 +58,11 @@ Please create a plan and new tasks in JSON format.
         existing_tasks_str = ""
         if tasks_list:
             task_lines = []
+            tasks_by_id = self._get_tasks_by_id()
             for task_index in tasks_list:
                 task_id = task_index.get("id", "unknown")
-                # Load full task data to get current status
-                task = self.state_manager.get_task_by_id(task_id)
+                # Full task data (current status) from the bulk load
+                task = tasks_by_id.get(task_id)
                 if task:
                     task_status = task.status.value
                 else:
@@ -68,7 +79,7 @@ Please create a plan and new tasks in JSON format.
         if last_plan_judge:
             try:
                 last_plan_judge_str = json.dumps(
-                    last_plan_judge, indent=2, ensure_ascii=False
+                    last_plan_judge, indent=2, ensure_ascii=False, sort_keys=True
                 )
             except TypeError:
                 last_plan_judge_str = str(last_plan_judge)
@@ -87,7 +98,7 @@ Please create a plan and new tasks in JSON format.
         # フィードバックがまったく存在しない場合は簡易メッセージにする
         if any(v is not None for v in last_execution_feedback.values()):
             last_execution_feedback_str = json.dumps(
-                last_execution_feedback, indent=2, ensure_ascii=False
+                last_execution_feedback, indent=2, ensure_ascii=False, sort_keys=True
             )
         else:
             last_execution_feedback_str = "まだ Judge の実行結果フィードバックはありません。"
@@ -95,13 +106,17 @@ Please create a plan and new tasks in JSON format.
         # Get working directory from config
         working_dir = self.config.get("project_root", ".")
 
-        prompt = template.format(
+        prompt = render_template(
+            template,
             project_goal=self.config.get("project_goal", "未設定"),
             current_plan=plan if plan else "計画はまだ作成されていません",
             existing_tasks=existing_tasks_str,
              last_plan_judge_feedback=last_plan_judge_str,
              last_execution_feedback=last_execution_feedback_str,
-            codebase_summary=self._get_codebase_summary(),
+            codebase_summary=(
+                self._get_codebase_summary()
+                if "codebase_summary" in template_fields(template) else ""
+            ),
             working_dir=working_dir
         )
 
@@ -109,45 +124,27 @@ Please create a plan and new tasks in JSON format.
 
     def _get_codebase_summary(self) -> str:
         """Get codebase summary."""
-        # Simple implementation: list Python files
-        from pathlib import Path
-
-        project_root = Path(self.config.get("project_root", "."))
-        python_files = list(project_root.glob("**/*.py"))
-
-        if len(python_files) > 20:
-            return f"コードベースには {len(python_files)} 個以上のPythonファイルがあります。"
-        else:
-            file_list = "\n".join([f"- {f.relative_to(project_root)}" for f in python_files[:20]])
-            return f"主要なファイル:\n{file_list}"
+        return get_codebase_summary(self.config.get("project_root", "."))
 
     def parse_response(self, response: str) -> Dict[str, Any]:
         """Parse planner response."""
-        # Try to extract JSON from response
-        try:
-            # Look for JSON code block
-            json_match = re.search(r'```json\n(.*?)\n```', response, re.DOTALL)
-            if json_match:
-                return json.loads(json_match.group(1))
-
-            # Try to find JSON object directly
-            json_match = re.search(r'\{.*\}', response, re.DOTALL)
-            if json_match:
-                return json.loads(json_match.group(0))
+        return parse_llm_json(response, lambda error: self._fallback_result(response, error))
 
+    def _fallback_result(self, response: str, error: Optional[Exception]) -> Dict[str, Any]:
+        """Build planner result when the response contains no valid JSON."""
+        if error is None:
             # If no JSON found, return response as-is
             return {
                 "plan_update": response,
                 "new_tasks": [],
                 "reasoning": "JSON形式で出力されませんでした"
             }
-        except json.JSONDecodeError as e:
-            self.logger.warning(f"[{self.name}] Failed to parse JSON: {e}")
-            return {
-                "plan_update": response,
-                "new_tasks": [],
-                "reasoning": f"JSON解析エラー: {e}"
-            }
+        self.logger.warning(f"[{self.name}] Failed to parse JSON: {error}")
+        return {
+            "plan_update": response,
+            "new_tasks": [],
+            "reasoning": f"JSON解析エラー: {error}"
+        }
 
     def update_state(self, result: Dict[str, Any]) -> None:
         """Update state with planner result."""
@@ -196,31 +193,8 @@ Please create a plan and new tasks in JSON format.
 
     def _extract_files_from_description(self, description: str) -> list:
         """Extract file paths from task description."""
-        import re
-        files = []
-
-        # Pattern 1: Explicit file mentions
-        explicit_pattern = r'file:\s*([^\s\n]+\.(py|ts|js|md|json|yml|yaml|txt|html|css))'
-        matches = re.findall(explicit_pattern, description, re.IGNORECASE)
-        files.extend([m[0] for m in matches])
-
-        # Pattern 2: File paths in quotes
-        quoted_pattern = r'["\'`]([^\'"`]+\.(py|ts|js|md|json|yml|yaml|txt|html|css))["\'`]'
-        matches = re.findall(quoted_pattern, description, re.IGNORECASE)
-        files.extend([m[0] for m in matches])
-
-        # Normalize and deduplicate
-        normalized_files = []
-        seen = set()
-        for filepath in files:
-            normalized = filepath.strip().strip('"\'`')
-            if normalized and normalized not in seen:
-                normalized_files.append(normalized)
-                seen.add(normalized)
-
-        return normalized_files
-
-    def _get_timestamp(self) -> str:
-        """Get current timestamp."""
-        from datetime import datetime
-        return datetime.now().isoformat()
+        # Deduplicate preserving order
+        return list(dict.fromkeys(
+            (match.group(1) or match.group(2)).strip()
+            for match in _FILES_COMBINED_RE.finditer(description)
+        ))
@@ -0,0 +1,104 @@
+"""Prompt template loading shared by all agents."""
+
+import functools
+import os
+import string
+from typing import Any, FrozenSet, List, Optional, Tuple
+
+_formatter = string.Formatter()
+
+
+@functools.lru_cache(maxsize=16)
+def _read_template(path: str, mtime: float) -> str:
+    """Read template file. mtime is part of the cache key only."""
+    with open(path, 'r', encoding='utf-8') as f:
+        return f.read()
+
+
+def load_template(path: str, fallback: Optional[str] = None) -> str:
+    """
+    Load prompt template, reusing the cached content while the file is unchanged.
+
+    Only a stat() is issued per call; the file is re-read when its mtime changes.
+
+    Args:
+        path: Template file path
+        fallback: Template returned when the file does not exist
+
+    Returns:
+        Template content
+
+    Raises:
+        FileNotFoundError: If the template file does not exist and no fallback is given
+    """
+    try:
+        mtime = os.path.getmtime(path)
+        return _read_template(path, mtime)
+    except FileNotFoundError:
+        if fallback is None:
+            raise
+        return fallback
+
+
+@functools.lru_cache(maxsize=32)
+def _compile_template(template: str) -> Optional[List[Tuple[str, Optional[str]]]]:
+    """
+    Pre-parse template into (literal_text, field_name) pairs.
+
+    Returns:
+        Parsed segments, or None if the template uses format specs,
+        conversions or attribute/index access (rendered with str.format)
+    """
+    segments = []
+    for literal, field_name, format_spec, conversion in _formatter.parse(template):
+        if field_name is not None and (
+            format_spec or conversion or not field_name.isidentifier()
+        ):
+            return None
+        segments.append((literal, field_name))
+    return segments
+
+
+@functools.lru_cache(maxsize=32)
+def template_fields(template: str) -> FrozenSet[str]:
+    """
+    Get placeholder names used by a template.
+
+    Lets callers skip computing values (e.g. the codebase summary) that a
+    custom template does not reference.
+
+    Args:
+        template: Template string
+
+    Returns:
+        Set of placeholder names
+    """
+    return frozenset(
+        field_name for _, field_name, _, _ in _formatter.parse(template) if field_name
+    )
+
+
+def render_template(template: str, **fields: Any) -> str:
+    """
+    Render template, equivalent to template.format(**fields).
+
+    The template is parsed once and cached, so repeated renders only
+    concatenate strings.
+
+    Args:
+        template: Template string ({name} placeholders, {{ and }} escapes)
+        **fields: Values for the placeholders
+
+    Returns:
+        Rendered string
+
+    Raises:
+        KeyError: If a placeholder has no value
+    """
+    segments = _compile_template(template)
+    if segments is None:
+        return template.format(**fields)
+    return "".join([
+        literal + (str(fields[name]) if name is not None else "")
+        for literal, name in segments
+    ])
@@ -1,14 +1,34 @@
 """Worker agent implementation."""
 
 import re
-from typing import Dict, Any
+from typing import Dict, Any, Optional
 
 from .base import BaseAgent
+from .templates import load_template, render_template
 from orchestragent.models import Task
-from orchestragent.llm.model_selector import ModelSelector
-from orchestragent.tracking.intent_parser import IntentParser
-from orchestragent.tracking.intent_manager import IntentManager
-import config
+
+# Response / description patterns (compiled once)
+_RELATED_FILE_RE = re.compile(r'([\w\-_/]+\.(?:py|ts|json|js|md|yml|yaml))\b')
+_REPORT_HEADING = '# タスク完了レポート'
+# Commit hash and message in one pass.
+# Support formats: "コミットハッシュ: xxx" and "- **コミットハッシュ:** xxx"
+_COMMIT_INFO_RE = re.compile(
+    r'[-*]*\s*\**(?:'
+    r'コミットハッシュ[:\*\s]+`?(?P<hash>(?i:[a-f0-9]+))`?'
+    r'|コミットメッセージ[:\*\s]+`?(?P<msg>.+)`?'
+    r')'
+)
+
+
+# Fallback prompt used when the template file is missing
+_FALLBACK_WORKER_TEMPLATE = """# Worker Agent
+
+Task ID: {task_id}
+Task Title: {task_title}
+Task Description: {task_description}
+
+Please complete this task and report the result.
+"""
 
 
 class WorkerAgent(BaseAgent):
@@ -19,6 +39,15 @@ class WorkerAgent(BaseAgent):
         super().__init__(*args, **kwargs)
         self.mode = "agent"  # Worker uses agent mode (not plan)
         self.current_task_id = None
+        # Task loaded for the current run (shared by model selection and build_prompt)
+        self._current_task: Optional[Task] = None
+
+        # Worker-only dependencies are imported lazily so that importing the
+        # agents package (e.g. for Planner-only use) does not pull in config,
+        # yaml and the tracking package
+        import config
+        from orchestragent.llm.model_selector import ModelSelector
+        from orchestragent.tracking.intent_manager import IntentManager
 
         # Initialize model selector for dynamic model selection
         self.model_selector = ModelSelector(
@@ -34,13 +63,26 @@ class WorkerAgent(BaseAgent):
         # Initialize intent manager for tracking change intents
         self.intent_manager = IntentManager(state_dir=config.STATE_DIR)
 
+    def load_state(self) -> Dict[str, Any]:
+        """
+        Load current state.
+
+        Worker prompts are built from the assigned task file only, so the
+        plan/tasks/status snapshot is not loaded. This avoids re-reading the
+        shared state files once per worker when tasks run in parallel.
+
+        Returns:
+            Empty state dictionary
+        """
+        return {}
+
     def build_prompt(self, state: Dict[str, Any]) -> str:
         """Build prompt for worker."""
         # Get assigned task from current_task_id (set by assign_task)
         if not self.current_task_id:
             raise ValueError("No task assigned to worker. Call assign_task() first.")
 
-        task = self.state_manager.get_task_by_id(self.current_task_id)
+        task = self._get_current_task()
         if not task:
             raise ValueError(f"Task {self.current_task_id} not found")
 
@@ -50,25 +92,14 @@ class WorkerAgent(BaseAgent):
             "prompts/worker.md"
         )
 
-        try:
-            with open(prompt_template_path, 'r', encoding='utf-8') as f:
-                template = f.read()
-        except FileNotFoundError:
-            # Fallback to simple prompt
-            template = """# Worker Agent
-
-Task ID: {task_id}
-Task Title: {task_title}
-Task Description: {task_description}
-
-Please complete this task and report the result.
-"""
+        template = load_template(prompt_template_path, fallback=_FALLBACK_WORKER_TEMPLATE)
 
         # Get working directory from config
         working_dir = self.config.get("project_root", ".")
 
         # Format template
-        prompt = template.format(
+        prompt = render_template(
+            template,
             task_id=task.id,
             task_title=task.title,
             task_description=task.description,
@@ -83,42 +114,34 @@ Please complete this task and report the result.
         # Simple implementation: extract file names from description
         description = task.description
         # Look for file patterns in description
-        file_patterns = re.findall(r'[\w\-_/]+\.(py|ts|js|md|json|yml|yaml)', description)
-        if file_patterns:
-            return "\n".join([f"- {f}" for f in set(file_patterns)])
-        return "関連ファイルの情報がありません"
+        matches = _RELATED_FILE_RE.findall(description)
+        if not matches:
+            return "関連ファイルの情報がありません"
+        return "\n".join(f"- {f}" for f in dict.fromkeys(matches))
 
     def parse_response(self, response: str) -> Dict[str, Any]:
         """Parse worker response including Intent extraction."""
         try:
             # Extract report from response
-            # Try to find markdown report section
-            report_match = re.search(r'# タスク完了レポート.*', response, re.DOTALL)
-            if report_match:
-                report = report_match.group(0)
+            # Try to find markdown report section (heading to end of response)
+            report_start = response.find(_REPORT_HEADING)
+            if report_start != -1:
+                report = response[report_start:]
             else:
                 # If no structured report, use entire response
                 report = response
 
-            # Try to extract commit info
-            # Support formats: "コミットハッシュ: xxx" and "- **コミットハッシュ:** xxx"
+            # Try to extract commit info (first occurrence of each)
             commit_hash = None
             commit_message = None
-            commit_match = re.search(
-                r'[-*]*\s*\**コミットハッシュ[:\*\s]+`?([a-f0-9]+)`?',
-                response,
-                re.IGNORECASE
-            )
-            if commit_match:
-                commit_hash = commit_match.group(1)
-
-            msg_match = re.search(
-                r'[-*]*\s*\**コミットメッセージ[:\*\s]+`?(.+)`?',
-                response,
-                re.MULTILINE
-            )
-            if msg_match:
-                commit_message = msg_match.group(1).strip()
+            for match in _COMMIT_INFO_RE.finditer(response):
+                if match.group("hash") is not None:
+                    if commit_hash is None:
+                        commit_hash = match.group("hash")
+                elif commit_message is None:
+                    commit_message = match.group("msg").strip()
+                if commit_hash is not None and commit_message is not None:
+                    break
 
             result = {
                 "report": report,
@@ -132,6 +155,7 @@ Please complete this task and report the result.
                 result["task_id"] = self.current_task_id
 
             # Extract Intent information from response
+            from orchestragent.tracking.intent_parser import IntentParser
             intent_data = IntentParser.parse(response, self.current_task_id)
             if intent_data:
                 result["intent"] = intent_data
@@ -196,11 +220,6 @@ Please complete this task and report the result.
             completed_tasks=completed_count
         )
 
-    def _get_timestamp(self) -> str:
-        """Get current timestamp."""
-        from datetime import datetime
-        return datetime.now().isoformat()
-
     def assign_task(self, task_id: str) -> bool:
         """
         Assign a task to this worker.
@@ -222,11 +241,25 @@ Please complete this task and report the result.
 
         # Set current_task_id before assigning (used in build_prompt)
         self.current_task_id = task_id
+        self._current_task = None
 
         self.state_manager.assign_task(task_id, self.name)
         self.logger.info(f"[Worker] Assigned task {task_id}")
         return True
 
+    def _get_current_task(self) -> Optional[Task]:
+        """
+        Get the assigned task, loading its file at most once per run.
+
+        Returns:
+            Current task, or None if not found
+        """
+        task = self._current_task
+        if task is None or task.id != self.current_task_id:
+            task = self.state_manager.get_task_by_id(self.current_task_id)
+            self._current_task = task
+        return task
+
     def _run_internal(self, iteration: int, start_time: float) -> Dict[str, Any]:
         """
         Internal run method with dynamic model selection.
@@ -242,7 +275,8 @@ Please complete this task and report the result.
         if not self.current_task_id:
             raise ValueError("No task assigned to worker. Call assign_task() first.")
 
-        task = self.state_manager.get_task_by_id(self.current_task_id)
+        self._current_task = None
+        task = self._get_current_task()
         if not task:
             raise ValueError(f"Task {self.current_task_id} not found")
 
@@ -265,6 +299,7 @@ Please complete this task and report the result.
             result = super()._run_internal(iteration, start_time)
             return result
         finally:
+            self._current_task = None
             # Restore original model in config
             if selected_model != original_model:
                 self.config["model"] = original_model
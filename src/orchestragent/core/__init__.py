@@ -11,6 +11,7 @@ from .exceptions import (
 )
 from .logger import AgentLogger
 from .environment import is_running_in_container
+from .timeutil import now_iso
 
 __all__ = [
     # Exceptions
@@ -25,4 +26,6 @@ __all__ = [
     "AgentLogger",
     # Environment
     "is_running_in_container",
+    # Time
+    "now_iso",
 ]
@@ -1,22 +1,28 @@
 """Environment detection utilities for the orchestragent system."""
 
+import functools
 import os
 
 
+@functools.lru_cache(maxsize=1)
 def is_running_in_container() -> bool:
     """
     Check if running in container.
 
+    The result cannot change during the process lifetime, so the filesystem
+    probes run only on the first call.
+
     Returns:
         True if running inside a Docker container, False otherwise.
     """
     # Docker environment detection
-    if os.path.exists('/.dockerenv'):
+    if os.path.isfile('/.dockerenv'):
         return True
     # cgroup check
     try:
         with open('/proc/self/cgroup', 'r') as f:
-            return 'docker' in f.read()
-    except:
-        pass
-    return False
+            # The docker marker appears in the first lines; no need to read it all
+            data = f.read(4096)
+    except OSError:
+        data = ''
+    return 'docker' in data
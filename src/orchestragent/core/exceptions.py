@@ -38,8 +38,14 @@ class LLMTimeoutError(LLMError):
 class LLMRateLimitError(LLMError):
     """Rate limit error for LLM API calls."""
 
-    def __init__(self, message: str = "Rate limit exceeded", original_error: Optional[Exception] = None):
+    def __init__(
+        self,
+        message: str = "Rate limit exceeded",
+        original_error: Optional[Exception] = None,
+        retry_after: Optional[float] = None
+    ):
         super().__init__(message, retryable=True, original_error=original_error)
+        self.retry_after = retry_after
 
 
 class StateError(AgentError):
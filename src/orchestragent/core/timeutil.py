@@ -0,0 +1,16 @@
+"""Timestamp helpers."""
+
+import time
+
+
+def now_iso() -> str:
+    """
+    Get current UTC time as an ISO 8601 string.
+
+    Formats time.gmtime() directly instead of allocating a datetime object;
+    the output matches datetime.now(timezone.utc).isoformat(timespec="seconds").
+
+    Returns:
+        Timezone-aware timestamp with second precision (e.g. 2024-01-01T12:00:00+00:00)
+    """
+    return time.strftime('%Y-%m-%dT%H:%M:%S+00:00', time.gmtime())
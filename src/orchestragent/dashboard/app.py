@@ -3,102 +3,37 @@
 import threading
 from textual.app import App, ComposeResult
 from textual.containers import Container, Horizontal, Vertical
+from textual.css.query import NoMatches
 from textual.widgets import Tabs, Tab, Static, Log
 from textual import events
-from typing import Optional, Any
-
-# Try to import on decorator (different versions have different import paths)
-try:
-    from textual.on import on
-except ImportError:
-    try:
-        from textual import on
-    except ImportError:
-        # Fallback: define a simple decorator that works with message handlers
-        def on(message_type, selector=None):
-            def decorator(func):
-                func._textual_on = (message_type, selector)
-                return func
-            return decorator
-
-from orchestragent.runner.loop import run_main_loop
+from textual.timer import Timer
+from textual.widget import Widget
+from typing import Callable, Optional, Any
+
+import config
+from orchestragent.runner.loop import request_stop, run_main_loop
+from orchestragent.dashboard.widgets import (
+    OverviewWidget,
+    LogsWidget,
+    TasksWidget,
+    IntentsWidget,
+    SettingsWidget,
+)
+from orchestragent.state.manager import StateManager
+from orchestragent.tracking.intent_manager import IntentManager
+from orchestragent.tracking.adr_manager import ADRManager
+from orchestragent.tracking.git_helper import GitHelper
+
+# Refresh interval of each tab's widget (seconds)
+_LOGS_REFRESH_SECONDS = 0.5
+_OVERVIEW_REFRESH_SECONDS = 1.0
+_TASKS_REFRESH_SECONDS = 1.0
 
 
 class DashboardApp(App):
     """Main dashboard application."""
 
-    CSS = """
-    Screen {
-        background: $surface;
-    }
-
-    #header-bar {
-        height: 1;
-        dock: top;
-        background: $primary;
-        color: $text;
-        text-align: center;
-    }
-
-    #footer-bar {
-        height: 1;
-        dock: bottom;
-        background: $primary;
-        color: $text;
-    }
-
-    #tabs {
-        margin-top: 0;
-    }
-
-    #content {
-        height: 1fr;
-        width: 1fr;
-    }
-
-    .tab-content {
-        height: 1fr;
-        width: 1fr;
-        padding: 1;
-    }
-
-    .section-title {
-        margin: 1;
-        text-style: bold;
-    }
-
-    .content {
-        margin: 1;
-        padding: 1;
-    }
-
-    .spacer {
-        height: 1;
-    }
-
-    .task-list-container {
-        width: 50%;
-        height: 1fr;
-        padding: 0 1;
-    }
-
-    .task-detail-container {
-        width: 50%;
-        height: 1fr;
-        padding: 0 1;
-    }
-
-    #task-table {
-        height: 1fr;
-        margin-top: 1;
-        margin-bottom: 1;
-    }
-
-    #task-detail-scroll {
-        height: 1fr;
-        width: 1fr;
-    }
-    """
+    CSS_PATH = "app.tcss"
 
     TITLE = "orchestragent ダッシュボード"
     BINDINGS = [
@@ -115,6 +50,12 @@ class DashboardApp(App):
         self.intents_widget: Optional[Any] = None
         self.settings_widget: Optional[Any] = None
         self.current_tab: Optional[str] = None
+        self._refresh_timer: Optional[Timer] = None
+        # Shared by the overview and tasks tabs (created on first use)
+        self._state_manager: Optional[StateManager] = None
+        # Widgets from compose(), looked up once in on_mount
+        self._tabs: Optional[Tabs] = None
+        self._content: Optional[Container] = None
 
     def compose(self) -> ComposeResult:
         """Create child widgets for the app."""
@@ -132,6 +73,9 @@ class DashboardApp(App):
 
     def on_mount(self) -> None:
         """Called when app starts."""
+        self._tabs = self.query_one("#tabs", Tabs)
+        self._content = self.query_one("#content", Container)
+
         # Start main loop in background thread
         self._main_loop_running = True
         self.main_loop_thread = threading.Thread(
@@ -141,12 +85,8 @@ class DashboardApp(App):
         )
         self.main_loop_thread.start()
 
-        # Set up periodic updates
-        self.set_interval(0.5, self.update_display)
-
         # Show overview tab by default
-        tabs_widget = self.query_one("#tabs", Tabs)
-        tabs_widget.active = "overview"
+        self._tabs.active = "overview"
         self.current_tab = "overview"
         self._show_overview()
 
@@ -162,47 +102,46 @@ class DashboardApp(App):
         finally:
             self._main_loop_running = False
 
-    def update_display(self) -> None:
-        """Update the display with current state."""
-        # Check for tab changes
-        try:
-            tabs_widget = self.query_one("#tabs", Tabs)
-            active_tab = tabs_widget.active
-            if active_tab != self.current_tab:
-                self.watch_tabs_active(active_tab)
-        except Exception:
-            pass
-
-        # Update logs if logs widget is visible and mounted
-        if self.logs_widget and hasattr(self.logs_widget, 'update_logs'):
-            try:
-                # Check if widget is still in the DOM (has a parent)
-                if self.logs_widget._parent is not None:
-                    self.logs_widget.update_logs()
-            except Exception:
-                pass  # Silently ignore update errors
-
-        # Update tasks if tasks widget is visible
-        if self.tasks_widget and hasattr(self.tasks_widget, 'update_tasks'):
+    def on_tabs_tab_activated(self, event: Tabs.TabActivated) -> None:
+        """Switch content when a tab is activated (event-driven, no polling)."""
+        if event.tab is not None and event.tab.id:
+            self.watch_tabs_active(event.tab.id)
+
+    def _start_refresh(
+        self, interval: float, widget: Widget, update: Callable[[], None]
+    ) -> None:
+        """
+        Periodically refresh the active tab's widget.
+
+        Only the visible widget is refreshed, at a rate suited to its content.
+        Any previous refresh timer is stopped.
+
+        Args:
+            interval: Refresh interval in seconds
+            widget: Widget being refreshed
+            update: Widget update method
+        """
+        self._stop_refresh()
+
+        def refresh() -> None:
+            # Skip ticks while the widget is detached (e.g. during a tab switch)
+            if not widget.is_mounted or widget.parent is None:
+                return
             try:
-                self.tasks_widget.update_tasks()
-            except Exception:
-                pass
+                update()
+            except NoMatches:
+                pass  # Child widgets not composed yet
+            except (OSError, ValueError) as e:
+                # State files may be mid-write by the main loop; retry next tick
+                self.log(f"Refresh skipped: {e}")
 
-        # Update overview if visible
-        try:
-            overview = self.query_one("#overview-widget", default=None)
-            if overview and hasattr(overview, 'update_content'):
-                overview.update_content()
-        except Exception:
-            pass
+        self._refresh_timer = self.set_interval(interval, refresh)
 
-        # Update settings if visible
-        if self.settings_widget and hasattr(self.settings_widget, 'update_content'):
-            try:
-                self.settings_widget.update_content()
-            except Exception:
-                pass
+    def _stop_refresh(self) -> None:
+        """Stop the active tab's refresh timer."""
+        if self._refresh_timer is not None:
+            self._refresh_timer.stop()
+            self._refresh_timer = None
 
     def watch_tabs_active(self, active_tab: str) -> None:
         """Handle tab changes."""
@@ -211,15 +150,16 @@ class DashboardApp(App):
 
         self.current_tab = active_tab
 
-        # Clear widget references before switching (important to avoid NoActiveAppError)
+        # Stop refreshing the old tab and clear widget references before switching
+        # (important to avoid NoActiveAppError)
+        self._stop_refresh()
         self.logs_widget = None
         self.tasks_widget = None
         self.intents_widget = None
         self.settings_widget = None
 
         try:
-            content = self.query_one("#content", Container)
-            content.remove_children()
+            self._content.remove_children()
 
             if active_tab == "overview":
                 self._show_overview()
@@ -234,73 +174,57 @@ class DashboardApp(App):
         except Exception:
             pass  # Silently ignore errors during tab switching
 
+    def _get_state_manager(self) -> StateManager:
+        """Get the state manager shared by the dashboard tabs."""
+        if self._state_manager is None:
+            self._state_manager = StateManager(state_dir=config.STATE_DIR)
+        return self._state_manager
+
     def _show_overview(self) -> None:
         """Show overview tab content."""
-        from orchestragent.dashboard.widgets import OverviewWidget
-        from orchestragent.state.manager import StateManager
-        import config
-
-        content = self.query_one("#content", Container)
-        state_manager = StateManager(state_dir=config.STATE_DIR)
-        overview = OverviewWidget(state_manager)
-        content.mount(overview)
+        overview = OverviewWidget(self._get_state_manager())
+        self._content.mount(overview)
+        self._start_refresh(_OVERVIEW_REFRESH_SECONDS, overview, overview.update_content)
 
     def _show_logs(self) -> None:
         """Show logs tab content."""
-        from orchestragent.dashboard.widgets import LogsWidget
-
-        content = self.query_one("#content", Container)
         log_widget = LogsWidget()
-        content.mount(log_widget)
+        self._content.mount(log_widget)
         self.logs_widget = log_widget  # Store reference for updates
+        self._start_refresh(_LOGS_REFRESH_SECONDS, log_widget, log_widget.update_logs)
 
     def _show_tasks(self) -> None:
         """Show tasks tab content."""
-        from orchestragent.dashboard.widgets import TasksWidget
-        from orchestragent.state.manager import StateManager
-        import config
-
-        content = self.query_one("#content", Container)
-        state_manager = StateManager(state_dir=config.STATE_DIR)
-        tasks = TasksWidget(state_manager)
-        content.mount(tasks)
+        tasks = TasksWidget(self._get_state_manager())
+        self._content.mount(tasks)
         self.tasks_widget = tasks  # Store reference for updates
+        self._start_refresh(_TASKS_REFRESH_SECONDS, tasks, tasks.update_tasks)
 
     def _show_intents(self) -> None:
         """Show intents tab content."""
-        from orchestragent.dashboard.widgets import IntentsWidget
-        from orchestragent.tracking.intent_manager import IntentManager
-        from orchestragent.tracking.adr_manager import ADRManager
-        from orchestragent.tracking.git_helper import GitHelper
-        import config
-
-        content = self.query_one("#content", Container)
         intent_manager = IntentManager(state_dir=config.STATE_DIR)
         adr_manager = ADRManager(adr_dir=getattr(config, 'ADR_DIR', 'docs/adr'))
         # Use WORKING_DIR which is properly set for both container and host environments
-        git_helper = GitHelper(repo_path=str(config.WORKING_DIR) if config.WORKING_DIR else '.')
+        git_helper = GitHelper(repo_path=config.WORKING_DIR_STR)
         intents = IntentsWidget(intent_manager, adr_manager, git_helper)
-        content.mount(intents)
+        self._content.mount(intents)
         self.intents_widget = intents  # Store reference for updates
 
     def _show_settings(self) -> None:
         """Show settings tab content."""
-        from orchestragent.dashboard.widgets import SettingsWidget
-
-        content = self.query_one("#content", Container)
         settings = SettingsWidget()
-        content.mount(settings)
+        self._content.mount(settings)
         self.settings_widget = settings  # Store reference for updates
+        # Configuration is fixed at startup: rendered once on mount, no refresh timer
 
     def action_quit(self) -> None:
         """Handle quit action."""
         self._main_loop_running = False
+        # Let the main loop end at its next wait instead of being cut off mid-sleep
+        request_stop()
         self.exit()
 
     def action_toggle_dark(self) -> None:
         """Toggle dark mode."""
         # Toggle dark mode by adding/removing the dark class
-        if "-dark-mode" in self.classes:
-            self.remove_class("-dark-mode")
-        else:
-            self.add_class("-dark-mode")
+        self.toggle_class("-dark-mode")
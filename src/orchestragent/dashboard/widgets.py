@@ -1,15 +1,21 @@
 """Dashboard widgets for each tab."""
 
+import functools
+import os
 import sys
+import threading
+from datetime import datetime
 from textual.widgets import Static, DataTable, RichLog, TabbedContent, TabPane
 from textual.containers import Vertical, Horizontal, ScrollableContainer
-from textual import events
-from typing import Dict, Any, List, Optional, TYPE_CHECKING
+from textual import events, work
+from typing import BinaryIO, Dict, Any, List, Optional, TYPE_CHECKING
 from pathlib import Path
 
 import config
 from orchestragent.state.manager import StateManager
 from orchestragent.models import Task
+from orchestragent.core.environment import is_running_in_container
+from orchestragent.runner.startup import check_cursor_cli
 
 if TYPE_CHECKING:
     from orchestragent.tracking.intent_manager import IntentManager
@@ -17,6 +23,46 @@ if TYPE_CHECKING:
     from orchestragent.tracking.git_helper import GitHelper
 
 
+# Rich markup color per log level
+_LEVEL_COLORS = {"ERROR": "red", "WARNING": "yellow", "INFO": "cyan"}
+_LOG_SEPARATOR = ' - '
+
+
+def _format_log_line(line: str) -> str:
+    """
+    Strip the timestamp (and logger name) prefix from a log line and color it by level.
+
+    Handles both "2024-01-01 12:00:00 - INFO - message" and the file handler's
+    "2024-01-01 12:00:00 - agent_system - INFO - message". Lines in any other
+    format are returned as-is.
+
+    Args:
+        line: Log line without line ending
+
+    Returns:
+        Line for display (Rich markup)
+    """
+    # Log lines start with a timestamp; skip searching anything else
+    if not line[:1].isdigit():
+        return line
+    i = line.find(_LOG_SEPARATOR, 0, 40)
+    if i < 0:
+        return line
+    start = i + 3
+    j = line.find(_LOG_SEPARATOR, start)
+    if j < 0:
+        return line
+    level = line[start:j]
+    if level not in _LEVEL_COLORS:
+        # Might be the logger name: the level is the next field
+        k = line.find(_LOG_SEPARATOR, j + 3, j + 3 + 12)
+        if k >= 0 and line[j + 3:k] in _LEVEL_COLORS:
+            level, j = line[j + 3:k], k
+    message = line[j + 3:].strip()
+    color = _LEVEL_COLORS.get(level)
+    return f"[{color}]{message}[/{color}]" if color else message
+
+
 class OverviewWidget(ScrollableContainer):
     """Overview tab widget showing project goal, task statistics, and progress."""
 
@@ -24,6 +70,9 @@ class OverviewWidget(ScrollableContainer):
         super().__init__()
         self.state_manager = state_manager
         self.id = "overview-widget"
+        # Inputs of the last rendered progress / statistics; unchanged state skips the redraw
+        self._last_progress: Optional[tuple] = None
+        self._last_stats: Optional[tuple] = None
 
     def compose(self):
         """Create overview content."""
@@ -40,49 +89,69 @@ class OverviewWidget(ScrollableContainer):
 
     def on_mount(self) -> None:
         """Update content when mounted."""
-        self.update_content()
-
-    def update_content(self) -> None:
-        """Update overview content from state."""
-        # Project goal
+        # Project goal (static for the process lifetime)
         goal_widget = self.query_one("#project-goal", Static)
         goal = config.AGENT_CONFIG.get('project_goal', '未設定')
         goal_widget.update(f"[cyan]{goal}[/cyan]")
 
-        # Progress info
-        progress_widget = self.query_one("#progress-info", Static)
-        status = self.state_manager.get_status()
-        iteration = status.get('current_iteration', 0)
-        max_iterations = config.MAX_ITERATIONS
-        should_continue = status.get('should_continue', True)
+        self.update_content()
 
-        progress_text = f"""
-イテレーション: [bold]{iteration}[/bold] / {max_iterations}
-継続判定: [{'green' if should_continue else 'red'}]{'継続' if should_continue else '停止'}[/{'green' if should_continue else 'red'}]
-理由: {status.get('reason', 'N/A')}
-        """.strip()
-        progress_widget.update(progress_text)
+    def update_content(self) -> None:
+        """Update overview content from state (state files are read off the UI thread)."""
+        self._load_overview()
 
-        # Task statistics
-        stats_widget = self.query_one("#task-stats", Static)
+    @work(thread=True, exclusive=True, group="overview-update", exit_on_error=False)
+    def _load_overview(self) -> None:
+        """Read status and task statistics in a worker thread."""
+        status = self.state_manager.get_status()
         task_stats = self.state_manager.get_task_statistics()
-        total = task_stats.total
-        completed = task_stats.completed
-        failed = task_stats.failed
-        pending = task_stats.pending
-        in_progress = task_stats.in_progress
+        self.app.call_from_thread(self._apply_overview, status, task_stats)
 
-        completion_rate = (completed / total * 100) if total > 0 else 0
+    def _apply_overview(self, status: Dict[str, Any], task_stats: Any) -> None:
+        """Render overview content (runs on the UI thread)."""
+        if not self.is_mounted:
+            return
 
-        stats_text = f"""
+        # Progress info (re-rendered only when its inputs changed)
+        should_continue = status.get('should_continue', True)
+        progress = (status.get('current_iteration', 0), should_continue, status.get('reason', 'N/A'))
+        if progress != self._last_progress:
+            self._last_progress = progress
+            iteration, _, reason = progress
+            color = 'green' if should_continue else 'red'
+            label = '継続' if should_continue else '停止'
+            progress_text = f"""
+イテレーション: [bold]{iteration}[/bold] / {config.MAX_ITERATIONS}
+継続判定: [{color}]{label}[/{color}]
+理由: {reason}
+            """.strip()
+            self.query_one("#progress-info", Static).update(progress_text)
+
+        # Task statistics (re-rendered only when the counts changed)
+        stats = (
+            task_stats.total,
+            task_stats.completed,
+            task_stats.failed,
+            task_stats.pending,
+            task_stats.in_progress,
+        )
+        if stats != self._last_stats:
+            self._last_stats = stats
+            total, completed, failed, pending, in_progress = stats
+            completion_rate = (completed / total * 100) if total > 0 else 0
+            stats_text = f"""
 総タスク数: [bold]{total}[/bold]
 完了: [green]{completed}[/green]
 失敗: [red]{failed}[/red]
 保留中: [yellow]{pending}[/yellow]
 実行中: [cyan]{in_progress}[/cyan]
 完了率: [bold]{completion_rate:.1f}%[/bold]
-        """.strip()
-        stats_widget.update(stats_text)
+            """.strip()
+            self.query_one("#task-stats", Static).update(stats_text)
+
+
+# Bytes read from the end of an existing log file when the logs tab opens
+_INITIAL_TAIL_BYTES = 256 * 1024
 
 
 class LogsWidget(RichLog):
@@ -91,108 +160,118 @@ class LogsWidget(RichLog):
     def __init__(self):
         super().__init__(id="logs-widget", max_lines=1000, markup=True)
         self.log_file_path: Optional[Path] = None
+        # Bytes of the log file consumed so far (including the partial last line)
+        self.last_position = 0
+        # Log file kept open between ticks, its inode (rotation check) and
+        # the trailing partial line not yet terminated by a newline
+        self._fh: Optional[BinaryIO] = None
+        self._ino: Optional[int] = None
+        self._residual = b''
+        # Serializes the worker-thread reads with closing the handle on unmount
+        self._read_lock = threading.Lock()
+        self._unmounted = False
+        self._tail_loaded = False  # Existing content loaded (tail only) on first open
 
     def on_mount(self) -> None:
         """Set up log file monitoring and load existing logs."""
-        from datetime import datetime
         log_dir = Path(config.LOG_DIR)
-        log_file = log_dir / f"execution_{datetime.now().strftime('%Y%m%d')}.log"
-        self.log_file_path = log_file
+        self.log_file_path = log_dir / f"execution_{datetime.now().strftime('%Y%m%d')}.log"
 
         # Load existing log content when tab is opened
-        if log_file.exists():
-            try:
-                with open(log_file, 'r', encoding='utf-8') as f:
-                    all_lines = f.readlines()
-                    if all_lines:
-                        # Process and display all existing lines
-                        processed_lines = []
-                        for line in all_lines:
-                            line = line.rstrip('\n\r')
-                            if not line:
-                                continue
-
-                            # Remove timestamp prefix for cleaner display
-                            parts = line.split(' - ', 2)
-                            if len(parts) >= 3:
-                                level = parts[1]
-                                message = parts[2].strip()
-                                # Color code by level
-                                if level == "ERROR":
-                                    processed_lines.append(f"[red]{message}[/red]")
-                                elif level == "WARNING":
-                                    processed_lines.append(f"[yellow]{message}[/yellow]")
-                                elif level == "INFO":
-                                    processed_lines.append(f"[cyan]{message}[/cyan]")
-                                else:
-                                    processed_lines.append(message)
-                            else:
-                                processed_lines.append(line)
-
-                        # Write all existing lines
-                        if processed_lines and self._parent is not None:
-                            for line in processed_lines:
-                                self.write(line)
-
-                    # Set last_position to end of file for future updates
-                    f.seek(0, 2)  # Seek to end
-                    self.last_position = f.tell()
-            except Exception:
-                self.last_position = 0
-        else:
-            self.last_position = 0
+        self.update_logs()
+
+    def on_unmount(self) -> None:
+        """Release the log file handle."""
+        with self._read_lock:
+            self._unmounted = True
+            self._close_log_file()
+
+    def _close_log_file(self) -> None:
+        """Close the log file and forget the read position."""
+        if self._fh is not None:
+            self._fh.close()
+        self._fh = None
+        self._ino = None
+        self._residual = b''
+        self.last_position = 0
+
+    def _read_new_lines(self) -> List[str]:
+        """
+        Read complete lines appended to the log file since the last call.
+
+        Returns:
+            New lines (without line endings); empty if the file did not grow
+        """
+        try:
+            st = os.stat(self.log_file_path)
+        except OSError:
+            return []  # Not created yet
+
+        if self._fh is not None and (st.st_ino != self._ino or st.st_size < self.last_position):
+            # Rotated or truncated: start over on the new file
+            self._close_log_file()
+        elif st.st_size == self.last_position:
+            return []  # Nothing appended
+
+        if self._fh is None:
+            self._fh = open(self.log_file_path, 'rb')
+            self._ino = os.fstat(self._fh.fileno()).st_ino
+            if not self._tail_loaded:
+                self._tail_loaded = True
+                # Opening the tab late in a long run: only the end of the file can
+                # be shown (max_lines), so skip reading and parsing the rest
+                start = st.st_size - _INITIAL_TAIL_BYTES
+                if start > 0:
+                    self._fh.seek(start)
+                    self._fh.readline()  # Drop the partial first line
+                    self.last_position = self._fh.tell()
+
+        chunk = self._fh.read()
+        if not chunk:
+            return []
+        self.last_position += len(chunk)
+
+        *complete, self._residual = (self._residual + chunk).split(b'\n')
+        return [line.decode('utf-8', 'replace').rstrip('\r') for line in complete[-self.max_lines:]]
 
     def update_logs(self) -> None:
-        """Read new log entries from file."""
+        """Read new log entries from file (the file is read off the UI thread)."""
         # Check if widget is still mounted (has a parent)
         if self._parent is None:
             return
 
-        if not self.log_file_path or not self.log_file_path.exists():
+        if not self.log_file_path:
             return
 
+        self._load_logs()
+
+    @work(thread=True, exclusive=True, group="logs-update", exit_on_error=False)
+    def _load_logs(self) -> None:
+        """Read and format new log lines in a worker thread."""
+        # A previous read still running (thread workers cannot be interrupted):
+        # it will pick up the new lines as well
+        if not self._read_lock.acquire(blocking=False):
+            return
         try:
-            with open(self.log_file_path, 'r', encoding='utf-8') as f:
-                f.seek(self.last_position)
-                new_lines = f.readlines()
-                if new_lines:
-                    # Process all lines first
-                    processed_lines = []
-                    for line in new_lines:
-                        # Remove newline character and process
-                        line = line.rstrip('\n\r')
-                        if not line:
-                            continue
-
-                        # Remove timestamp prefix for cleaner display
-                        # Format: "2024-01-01 12:00:00 - INFO - message"
-                        parts = line.split(' - ', 2)
-                        if len(parts) >= 3:
-                            level = parts[1]
-                            message = parts[2].strip()
-                            # Color code by level
-                            if level == "ERROR":
-                                processed_lines.append(f"[red]{message}[/red]")
-                            elif level == "WARNING":
-                                processed_lines.append(f"[yellow]{message}[/yellow]")
-                            elif level == "INFO":
-                                processed_lines.append(f"[cyan]{message}[/cyan]")
-                            else:
-                                processed_lines.append(message)
-                        else:
-                            # If format doesn't match, just write the line as-is
-                            processed_lines.append(line)
-
-                    # Write each line using RichLog.write()
-                    # Check again if still mounted before writing
-                    if processed_lines and self._parent is not None:
-                        for line in processed_lines:
-                            self.write(line)
-
-                    self.last_position = f.tell()
-        except Exception as e:
-            # Silently ignore read errors (including NoActiveAppError)
-            pass
+            if self._unmounted:
+                return  # Handle already released; do not reopen it
+            new_lines = self._read_new_lines()
+        except OSError:
+            # Silently ignore read errors
+            return
+        finally:
+            self._read_lock.release()
+
+        # One RichLog.write() for the whole batch (a single refresh instead
+        # of one per line; RichLog splits the text into rows itself)
+        text = "\n".join(_format_log_line(line) for line in new_lines if line)
+        if text:
+            self.app.call_from_thread(self._write_logs, text)
+
+    def _write_logs(self, text: str) -> None:
+        """Append formatted log text (runs on the UI thread)."""
+        if self._parent is not None:
+            self.write(text)
 
 
 class TasksWidget(ScrollableContainer):
@@ -205,6 +284,10 @@ class TasksWidget(ScrollableContainer):
         self.selected_task_id: Optional[str] = None
         self._updating = False
         self._last_task_ids: List[str] = []  # Track task IDs for diff update
+        self._last_task_data: Dict[str, Dict[str, str]] = {}  # Row data shown last time
+        self._row_keys: set = set()  # Task IDs currently in the table (kept in sync with add/remove)
+        self._col_keys: list = []  # Column keys returned by add_columns (status, ID, title, priority)
+        self._detail_fingerprint: Optional[tuple] = None  # (id, updated_at, status) of the shown detail
 
     def compose(self):
         """Create tasks content."""
@@ -222,29 +305,44 @@ class TasksWidget(ScrollableContainer):
         """Set up task table."""
         table = self.query_one("#task-table", DataTable)
         # Column order: Status, ID, Title, Priority
-        table.add_columns("ステータス", "ID", "タイトル", "優先度")
+        # Keep the generated column keys for update_cell (labels are not keys)
+        self._col_keys = table.add_columns("ステータス", "ID", "タイトル", "優先度")
         table.cursor_type = "row"
         self.update_tasks()
 
+    # Colored label per task status
+    _STATUS_COLORS = {
+        'pending': '[yellow]保留中[/yellow]',
+        'in_progress': '[cyan]実行中[/cyan]',
+        'completed': '[green]完了[/green]',
+        'failed': '[red]失敗[/red]'
+    }
+
     def _get_status_colored(self, status: str) -> str:
         """Get colored status text."""
-        return {
-            'pending': '[yellow]保留中[/yellow]',
-            'in_progress': '[cyan]実行中[/cyan]',
-            'completed': '[green]完了[/green]',
-            'failed': '[red]失敗[/red]'
-        }.get(status, status)
+        return self._STATUS_COLORS.get(status, status)
 
     def update_tasks(self) -> None:
-        """Update task list from state using diff update to preserve cursor position."""
+        """Update task list from state (task files are read off the UI thread)."""
         # Skip update if we're already updating
         if self._updating:
             return
+        self._load_tasks()
+
+    @work(thread=True, exclusive=True, group="tasks-update", exit_on_error=False)
+    def _load_tasks(self) -> None:
+        """Read all task files in a worker thread."""
+        all_tasks = self.state_manager.get_all_tasks_from_files()
+        self.app.call_from_thread(self._apply_tasks, all_tasks)
+
+    def _apply_tasks(self, all_tasks: List[Task]) -> None:
+        """Update the task table using diff update to preserve cursor position."""
+        if not self.is_mounted:
+            return
 
         self._updating = True
         try:
             table = self.query_one("#task-table", DataTable)
-            all_tasks = self.state_manager.get_all_tasks_from_files()
 
             # Build current task data
             current_task_ids = []
@@ -258,10 +356,11 @@ class TasksWidget(ScrollableContainer):
                     'priority': task.priority.value
                 }
 
-            # Get existing row keys
-            existing_keys = set()
-            for row_key in table.rows.keys():
-                existing_keys.add(str(row_key.value))
+            # Nothing changed since the last tick: skip the table diff entirely
+            if current_task_ids == self._last_task_ids and task_data_map == self._last_task_data:
+                return
+
+            existing_keys = self._row_keys
 
             # If table is empty (first load), just add all rows
             if not existing_keys:
@@ -274,28 +373,42 @@ class TasksWidget(ScrollableContainer):
                         data['priority'],
                         key=task_id
                     )
+                    existing_keys.add(task_id)
                 self._last_task_ids = current_task_ids
+                self._last_task_data = task_data_map
                 return
 
-            # Update existing rows (only status changes are likely)
+            # Update existing rows whose data changed (only status changes are likely)
             for task_id in current_task_ids:
-                if task_id in existing_keys:
-                    # Update existing row - use update_cell for each column
+                if task_id in existing_keys and task_data_map[task_id] != self._last_task_data.get(task_id):
+                    # Update only the cells that changed (the ID column always
+                    # matches the row key)
                     data = task_data_map[task_id]
+                    last = self._last_task_data.get(task_id, {})
+                    status_key, _, title_key, priority_key = self._col_keys
                     try:
-                        # Update status (column 0)
-                        table.update_cell(task_id, "ステータス", self._get_status_colored(data['status']))
-                        # Update ID (column 1) - should stay in sync with row key
-                        table.update_cell(task_id, "ID", task_id)
-                        # Update title (column 2)
-                        table.update_cell(task_id, "タイトル", data['title'])
-                        # Update priority (column 3)
-                        table.update_cell(task_id, "優先度", data['priority'])
+                        if data['status'] != last.get('status'):
+                            table.update_cell(task_id, status_key, self._get_status_colored(data['status']))
+                        if data['title'] != last.get('title'):
+                            table.update_cell(task_id, title_key, data['title'])
+                        if data['priority'] != last.get('priority'):
+                            table.update_cell(task_id, priority_key, data['priority'])
                     except Exception:
                         pass  # Ignore errors during update
 
+            current_set = set(current_task_ids)
+
+            # Remove deleted rows
+            deleted_task_ids = existing_keys - current_set
+            for task_id in deleted_task_ids:
+                try:
+                    table.remove_row(task_id)
+                except Exception:
+                    pass  # Ignore errors during removal
+                existing_keys.discard(task_id)
+
             # Add new rows
-            new_task_ids = set(current_task_ids) - existing_keys
+            new_task_ids = current_set - existing_keys
             for task_id in current_task_ids:
                 if task_id in new_task_ids:
                     data = task_data_map[task_id]
@@ -306,16 +419,10 @@ class TasksWidget(ScrollableContainer):
                         data['priority'],
                         key=task_id
                     )
-
-            # Remove deleted rows
-            deleted_task_ids = existing_keys - set(current_task_ids)
-            for task_id in deleted_task_ids:
-                try:
-                    table.remove_row(task_id)
-                except Exception:
-                    pass  # Ignore errors during removal
+                    existing_keys.add(task_id)
 
             self._last_task_ids = current_task_ids
+            self._last_task_data = task_data_map
         finally:
             self._updating = False
 
@@ -336,85 +443,70 @@ class TasksWidget(ScrollableContainer):
         if not task:
             return
 
-        detail_widget = self.query_one("#task-detail", Static)
-
         updated_at = task.updated_at or task.completed_at or task.failed_at or 'N/A'
+
+        # Same task, unchanged since it was last shown: keep the rendered panel
+        fingerprint = (task.id, updated_at, task.status.value)
+        if fingerprint == self._detail_fingerprint:
+            return
+        self._detail_fingerprint = fingerprint
+
         files_str = ', '.join(task.files) if task.files else 'なし'
-        detail_text = f"""
-[bold]ID:[/bold] {task.id}
-[bold]タイトル:[/bold] {task.title}
-[bold]ステータス:[/bold] {task.status.value}
-[bold]優先度:[/bold] {task.priority.value}
-[bold]作成日時:[/bold] {task.created_at or 'N/A'}
-[bold]更新日時:[/bold] {updated_at}
-
-[bold]説明:[/bold]
-{task.description or '説明なし'}
-
-[bold]ファイル:[/bold]
-{files_str}
-        """.strip()
+        parts = [
+            f"[bold]ID:[/bold] {task.id}",
+            f"[bold]タイトル:[/bold] {task.title}",
+            f"[bold]ステータス:[/bold] {task.status.value}",
+            f"[bold]優先度:[/bold] {task.priority.value}",
+            f"[bold]作成日時:[/bold] {task.created_at or 'N/A'}",
+            f"[bold]更新日時:[/bold] {updated_at}",
+            "",
+            "[bold]説明:[/bold]",
+            task.description or '説明なし',
+            "",
+            "[bold]ファイル:[/bold]",
+            files_str,
+        ]
 
         if task.is_completed() and task.result:
             result_report = task.result.report if hasattr(task.result, 'report') else task.result.get('report', 'N/A')
-            detail_text += f"\n\n[bold]結果:[/bold]\n{result_report}"
+            parts += ["", "[bold]結果:[/bold]", str(result_report)]
         elif task.is_failed() and task.error:
-            detail_text += f"\n\n[bold]エラー:[/bold]\n[red]{task.error}[/red]"
-
-        detail_widget.update(detail_text)
-
-
-class SettingsWidget(ScrollableContainer):
-    """Settings tab widget showing configuration and environment info."""
+            parts += ["", "[bold]エラー:[/bold]", f"[red]{task.error}[/red]"]
 
-    def compose(self):
-        """Create settings content."""
-        yield Static("[bold]プロジェクト設定[/bold]", classes="section-title")
-        yield Static(id="project-config", classes="content")
+        self.query_one("#task-detail", Static).update("\n".join(parts))
 
-        yield Static("", classes="spacer")
-        yield Static("[bold]LLM設定[/bold]", classes="section-title")
-        yield Static(id="llm-config", classes="content")
-        yield Static(id="model-config", classes="content")
-
-        yield Static("", classes="spacer")
-        yield Static("[bold]メインループ設定[/bold]", classes="section-title")
-        yield Static(id="loop-config", classes="content")
 
-        yield Static("", classes="spacer")
-        yield Static("[bold]環境情報[/bold]", classes="section-title")
-        yield Static(id="env-info", classes="content")
+@functools.lru_cache(maxsize=1)
+def _settings_texts() -> Dict[str, str]:
+    """
+    Build the settings tab text for each section.
 
-    def on_mount(self) -> None:
-        """Update content when mounted."""
-        self.update_content()
+    Everything shown comes from configuration fixed at startup, so it is built
+    once per process and reused by every SettingsWidget (one is created per tab
+    activation).
 
-    def update_content(self) -> None:
-        """Update settings content."""
-        # Project configuration
-        project_widget = self.query_one("#project-config", Static)
-        target_project_info = f"\n対象プロジェクト: {config.TARGET_PROJECT}" if config.TARGET_PROJECT else ""
-        project_text = f"""
+    Returns:
+        Text per section widget ID
+    """
+    # Project configuration
+    target_project_info = f"\n対象プロジェクト: {config.TARGET_PROJECT}" if config.TARGET_PROJECT else ""
+    project_text = f"""
 プロジェクトルート: {config.PROJECT_ROOT}
 プロジェクト目標: {config.AGENT_CONFIG.get('project_goal', '未設定')}{target_project_info}
 状態ディレクトリ: {config.STATE_DIR}
 ログディレクトリ: {config.LOG_DIR}
 ログレベル: {config.LOG_LEVEL}
-        """.strip()
-        project_widget.update(project_text)
+    """.strip()
 
-        # LLM configuration
-        llm_widget = self.query_one("#llm-config", Static)
-        llm_text = f"""
+    # LLM configuration
+    llm_text = f"""
 バックエンド: {config.LLM_BACKEND}
 出力形式: {config.LLM_OUTPUT_FORMAT}
 デフォルトモデル (LLM_MODEL): {config.LLM_MODEL or '(未設定)'}
-        """.strip()
-        llm_widget.update(llm_text)
+    """.strip()
 
-        # Model configuration (per agent & dynamic selection)
-        model_widget = self.query_one("#model-config", Static)
-        model_text = f"""
+    # Model configuration (per agent & dynamic selection)
+    model_text = f"""
 [bold]エージェント別モデル[/bold]
 Planner モデル: {config.PLANNER_MODEL or '(デフォルト)'}
 Worker モデル: {config.WORKER_MODEL or '(デフォルト)'}
@@ -427,35 +519,72 @@ Judge モデル: {config.JUDGE_MODEL or '(デフォルト)'}
 複雑タスク用モデル: {config.WORKER_MODEL_POWERFUL or '(デフォルト)'}
 軽量判定閾値: {config.MODEL_COMPLEXITY_THRESHOLD_LIGHT}
 複雑判定閾値: {config.MODEL_COMPLEXITY_THRESHOLD_POWERFUL}
-        """.strip()
-        model_widget.update(model_text)
+    """.strip()
 
-        # Main loop configuration
-        loop_widget = self.query_one("#loop-config", Static)
-        loop_text = f"""
+    # Main loop configuration
+    loop_text = f"""
 待機時間: {config.WAIT_TIME_SECONDS}秒
 最大イテレーション数: {config.MAX_ITERATIONS}
 最大リトライ数: {config.MAX_RETRIES}
 並列実行: {'有効' if config.ENABLE_PARALLEL_EXECUTION else '無効'}
 最大並列Worker数: {config.MAX_PARALLEL_WORKERS if config.ENABLE_PARALLEL_EXECUTION else 'N/A'}
-        """.strip()
-        loop_widget.update(loop_text)
-
-        # Environment information
-        env_widget = self.query_one("#env-info", Static)
-        import os
-        from orchestragent.core.environment import is_running_in_container
-        from orchestragent.runner.startup import check_cursor_cli
+    """.strip()
 
-        is_container = is_running_in_container()
-        cursor_available = check_cursor_cli()
+    # Environment information
+    is_container = is_running_in_container()
+    cursor_available = check_cursor_cli()
 
-        env_text = f"""
+    env_text = f"""
 実行環境: {'コンテナ内' if is_container else 'ホスト環境'}
 Cursor CLI: {'利用可能' if cursor_available else '未検出'}
 Python バージョン: {sys.version.split()[0]}
-        """.strip()
-        env_widget.update(env_text)
+    """.strip()
+
+    return {
+        "project-config": project_text,
+        "llm-config": llm_text,
+        "model-config": model_text,
+        "loop-config": loop_text,
+        "env-info": env_text,
+    }
+
+
+class SettingsWidget(ScrollableContainer):
+    """Settings tab widget showing configuration and environment info."""
+
+    def __init__(self):
+        super().__init__()
+        self._rendered = False
+
+    def compose(self):
+        """Create settings content."""
+        yield Static("[bold]プロジェクト設定[/bold]", classes="section-title")
+        yield Static(id="project-config", classes="content")
+
+        yield Static("", classes="spacer")
+        yield Static("[bold]LLM設定[/bold]", classes="section-title")
+        yield Static(id="llm-config", classes="content")
+        yield Static(id="model-config", classes="content")
+
+        yield Static("", classes="spacer")
+        yield Static("[bold]メインループ設定[/bold]", classes="section-title")
+        yield Static(id="loop-config", classes="content")
+
+        yield Static("", classes="spacer")
+        yield Static("[bold]環境情報[/bold]", classes="section-title")
+        yield Static(id="env-info", classes="content")
+
+    def on_mount(self) -> None:
+        """Update content when mounted."""
+        self.update_content()
+
+    def update_content(self) -> None:
+        """Update settings content (configuration is fixed, so render once)."""
+        if self._rendered:
+            return
+        self._rendered = True
+        for widget_id, text in _settings_texts().items():
+            self.query_one(f"#{widget_id}", Static).update(text)
 
 
 class IntentsWidget(ScrollableContainer):
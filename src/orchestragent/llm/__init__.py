@@ -4,10 +4,12 @@ from .client import LLMClient
 from .factory import LLMClientFactory
 from .cursor_cli import CursorCLIClient
 from .model_selector import ModelSelector
+from .semantic_cache import SemanticCache
 
 __all__ = [
     "LLMClient",
     "LLMClientFactory",
     "CursorCLIClient",
     "ModelSelector",
+    "SemanticCache",
 ]
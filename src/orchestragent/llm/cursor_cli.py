@@ -1,5 +1,7 @@
 """Cursor CLI client implementation."""
 
+import re
+import shutil
 import subprocess
 import threading
 from pathlib import Path
@@ -11,6 +13,9 @@ from orchestragent.core.exceptions import LLMError, LLMTimeoutError, LLMRateLimi
 if TYPE_CHECKING:
     from orchestragent.core.logger import AgentLogger
 
+# "Retry-After: 30" / "retry after 30s" in rate limit messages
+_RETRY_AFTER_RE = re.compile(r'retry[- ]after:?\s*(\d+(?:\.\d+)?)', re.IGNORECASE)
+
 
 class CursorCLIClient(LLMClient):
     """Client for executing agents via Cursor CLI."""
@@ -33,6 +38,24 @@ class CursorCLIClient(LLMClient):
                 f"Project root is not a directory: {self.project_root}"
             )
         self.output_format = output_format
+        # Resolved path of the `agent` executable (looked up once, reused per call)
+        self._executable: Optional[str] = None
+
+    def _get_executable(self) -> str:
+        """
+        Get the Cursor CLI executable, resolving it on PATH only once.
+
+        Returns:
+            Absolute path of `agent`, or "agent" if it is not on PATH
+            (Popen then raises FileNotFoundError as before)
+        """
+        if self._executable is None:
+            resolved = shutil.which('agent')
+            if resolved is None:
+                # Not cached so that a later install is picked up
+                return 'agent'
+            self._executable = resolved
+        return self._executable
 
     def call_agent(
         self,
@@ -57,7 +80,7 @@ class CursorCLIClient(LLMClient):
         Returns:
             Agent output (string)
         """
-        cmd = ['agent', '-p', prompt, '--output-format', self.output_format]
+        cmd = [self._get_executable(), '-p', prompt, '--output-format', self.output_format]
 
         if mode != "agent":
             cmd.extend(['--mode', mode])
@@ -158,7 +181,11 @@ class CursorCLIClient(LLMClient):
             stderr = output_text or ""
             # Check for rate limit errors
             if "rate limit" in stderr.lower() or "429" in stderr:
-                raise LLMRateLimitError(f"Cursor CLI rate limit: {stderr}")
+                retry_after_match = _RETRY_AFTER_RE.search(stderr)
+                raise LLMRateLimitError(
+                    f"Cursor CLI rate limit: {stderr}",
+                    retry_after=float(retry_after_match.group(1)) if retry_after_match else None
+                )
             # Check for timeout-like errors (in message)
             if "timeout" in stderr.lower():
                 raise LLMTimeoutError(timeout, RuntimeError(stderr))
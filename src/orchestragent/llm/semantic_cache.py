@@ -0,0 +1,139 @@
+"""Similarity-based response cache for near-duplicate prompts."""
+
+import math
+import re
+import threading
+from collections import Counter, OrderedDict
+from typing import Dict, Hashable, Optional, Tuple
+
+# Timestamps (ISO 8601 etc.) change every iteration but carry no meaning for
+# the evaluation, so they are masked before comparison.
+_TIMESTAMP_RE = re.compile(
+    r'\d{4}-\d{2}-\d{2}[T ]\d{2}:\d{2}(?::\d{2}(?:\.\d+)?)?(?:Z|[+-]\d{2}:?\d{2})?'
+)
+_WHITESPACE_RE = re.compile(r'\s+')
+# Numbers (task counts, iteration, task IDs) decide the evaluation, so prompts
+# only match when all of their numbers are identical.
+_NUMBER_RE = re.compile(r'\d+')
+
+# Default similarity thresholds per agent mode.
+# Planner output is less tolerant of drift than evaluator (ask) output.
+DEFAULT_THRESHOLDS = {
+    "ask": 0.92,
+    "plan": 0.98,
+}
+
+
+def _normalize(text: str) -> str:
+    """Normalize prompt text for similarity comparison."""
+    text = _TIMESTAMP_RE.sub("<ts>", text)
+    return _WHITESPACE_RE.sub(" ", text).strip()
+
+
+def _vectorize(text: str) -> Tuple[Counter, float, Tuple[str, ...]]:
+    """
+    Build a character trigram frequency vector.
+
+    Character n-grams work for both English and Japanese prompts without a
+    tokenizer or embedding model.
+
+    Returns:
+        Tuple of (trigram counter, vector norm, numbers in the text)
+    """
+    normalized = _normalize(text)
+    vector = Counter(normalized[i:i + 3] for i in range(max(len(normalized) - 2, 1)))
+    norm = math.sqrt(sum(v * v for v in vector.values()))
+    return vector, norm, tuple(_NUMBER_RE.findall(normalized))
+
+
+def _cosine(a: Counter, a_norm: float, b: Counter, b_norm: float) -> float:
+    """Cosine similarity between two sparse vectors."""
+    if not a_norm or not b_norm:
+        return 0.0
+    if len(a) > len(b):
+        a, b = b, a
+    dot = sum(v * b.get(k, 0) for k, v in a.items())
+    return dot / (a_norm * b_norm)
+
+
+class SemanticCache:
+    """Cache that returns a previous response for a sufficiently similar prompt.
+
+    Entries are scoped by namespace (e.g. agent name, mode, model) so that
+    responses are never shared between different agents. Only prompts with
+    exactly the same numbers are compared; the similarity threshold applies
+    to the remaining text.
+    """
+
+    def __init__(self, maxsize: int = 64):
+        """
+        Initialize semantic cache.
+
+        Args:
+            maxsize: Maximum number of entries kept per namespace
+        """
+        self.maxsize = maxsize
+        self._entries: Dict[
+            Hashable, "OrderedDict[int, Tuple[Counter, float, Tuple[str, ...], str]]"
+        ] = {}
+        self._next_id = 0
+        self._lock = threading.Lock()
+
+    def lookup(
+        self,
+        prompt: str,
+        threshold: float,
+        namespace: Hashable = None
+    ) -> Optional[Tuple[str, float]]:
+        """
+        Find a cached response for a similar prompt.
+
+        Args:
+            prompt: Prompt string
+            threshold: Minimum cosine similarity (0.0 - 1.0)
+            namespace: Cache namespace
+
+        Returns:
+            Tuple of (response, similarity), or None if no entry is similar enough
+        """
+        vector, norm, numbers = _vectorize(prompt)
+        with self._lock:
+            entries = self._entries.get(namespace)
+            if not entries:
+                return None
+
+            best_id: Optional[int] = None
+            best_score = threshold
+            for entry_id, (other, other_norm, other_numbers, _) in entries.items():
+                if other_numbers != numbers:
+                    continue
+                score = _cosine(vector, norm, other, other_norm)
+                if score >= best_score:
+                    best_id, best_score = entry_id, score
+
+            if best_id is None:
+                return None
+            entries.move_to_end(best_id)
+            return entries[best_id][3], best_score
+
+    def insert(self, prompt: str, response: str, namespace: Hashable = None) -> None:
+        """
+        Insert a prompt/response pair.
+
+        Args:
+            prompt: Prompt string
+            response: LLM response
+            namespace: Cache namespace
+        """
+        vector, norm, numbers = _vectorize(prompt)
+        with self._lock:
+            entries = self._entries.setdefault(namespace, OrderedDict())
+            entries[self._next_id] = (vector, norm, numbers, response)
+            self._next_id += 1
+            while len(entries) > self.maxsize:
+                entries.popitem(last=False)
+
+    def clear(self) -> None:
+        """Remove all entries."""
+        with self._lock:
+            self._entries.clear()
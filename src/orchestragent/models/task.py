@@ -1,5 +1,6 @@
 """Task-related data models."""
 
+from collections import Counter
 from dataclasses import dataclass, field
 from datetime import datetime
 from enum import Enum
@@ -296,10 +297,11 @@ class TaskStatistics:
     @classmethod
     def from_tasks(cls, tasks: List[Task]) -> "TaskStatistics":
         """Calculate statistics from task list."""
+        statuses = Counter(t.status for t in tasks)
         return cls(
             total=len(tasks),
-            completed=len([t for t in tasks if t.is_completed()]),
-            failed=len([t for t in tasks if t.is_failed()]),
-            pending=len([t for t in tasks if t.is_pending()]),
-            in_progress=len([t for t in tasks if t.is_in_progress()]),
+            completed=statuses[TaskStatus.COMPLETED],
+            failed=statuses[TaskStatus.FAILED],
+            pending=statuses[TaskStatus.PENDING],
+            in_progress=statuses[TaskStatus.IN_PROGRESS],
         )
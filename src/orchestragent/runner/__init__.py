@@ -6,15 +6,18 @@ This module provides the main execution loop and startup utilities.
 from .startup import (
     check_cursor_cli,
     check_cursor_auth,
+    cursor_auth_locations,
     authenticate_cursor,
     print_configuration,
 )
-from .loop import run_main_loop
+from .loop import run_main_loop, request_stop
 
 __all__ = [
     "check_cursor_cli",
     "check_cursor_auth",
+    "cursor_auth_locations",
     "authenticate_cursor",
     "print_configuration",
     "run_main_loop",
+    "request_stop",
 ]
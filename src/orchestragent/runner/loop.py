@@ -1,31 +1,76 @@
 """Main loop logic for the agent system."""
 
-import time
-from pathlib import Path
+from __future__ import annotations
+
+import threading
+from collections import ChainMap
 from concurrent.futures import ThreadPoolExecutor, as_completed
-from typing import Dict, Any
+from typing import TYPE_CHECKING, Dict, Any
 
 import config
 from orchestragent.core.environment import is_running_in_container
 from orchestragent.core.exceptions import AgentError
-from orchestragent.core.logger import AgentLogger
-from orchestragent.llm.factory import LLMClientFactory
-from orchestragent.state.manager import StateManager
-from orchestragent.state.file_lock import FileLockManager
-from orchestragent.scheduler.task_scheduler import TaskScheduler
-from orchestragent.agents.planner import PlannerAgent
-from orchestragent.agents.worker import WorkerAgent
-from orchestragent.agents.judge import JudgeAgent
-from orchestragent.agents.plan_judge import PlanJudgeAgent
+
+if TYPE_CHECKING:
+    from orchestragent.core.logger import AgentLogger
+    from orchestragent.state.manager import StateManager
 
 from .startup import (
     check_cursor_cli,
     check_cursor_auth,
+    cursor_auth_locations,
     authenticate_cursor,
     print_configuration,
 )
 
 
+# Set to end the main loop at its next wait (e.g. when the dashboard quits)
+_stop_event = threading.Event()
+
+
+def request_stop() -> None:
+    """Ask the main loop to stop at its next wait instead of sleeping it out."""
+    _stop_event.set()
+
+
+def _wait_or_stop(seconds: float) -> bool:
+    """
+    Wait between phases, returning early if a stop is requested.
+
+    Args:
+        seconds: Wait time in seconds
+
+    Returns:
+        True if a stop was requested
+    """
+    return _stop_event.wait(seconds)
+
+
+def _save_snapshots(state_manager: StateManager, logger: AgentLogger, iteration: int) -> None:
+    """
+    Create the per-iteration checkpoint and, every 5 iterations, a backup.
+
+    Args:
+        state_manager: State manager
+        logger: Logger
+        iteration: Iteration that just finished
+    """
+    # Create checkpoint after each iteration
+    try:
+        checkpoint_path = state_manager.create_checkpoint()
+        logger.info(f"Checkpoint created after iteration {iteration}: {checkpoint_path}")
+    except Exception as e:
+        logger.warning(f"Failed to create checkpoint: {e}")
+
+    # Create backup periodically (every 5 iterations)
+    if iteration % 5 == 0:
+        try:
+            backup_path = state_manager.create_backup()
+            logger.info(f"Backup created: {backup_path}")
+        except Exception as e:
+            logger.warning(f"Failed to create backup: {e}")
+
+
 def run_main_loop() -> None:
     """
     Run the main agent loop.
@@ -35,6 +80,7 @@ def run_main_loop() -> None:
     print("orchestragent")
     print("Phase 1: 動作確認")
     print("=" * 60)
+    _stop_event.clear()
 
     # Print configuration at the start
     print_configuration()
@@ -53,27 +99,48 @@ def run_main_loop() -> None:
     auth_status = check_cursor_auth()
     if not auth_status:
         print("\n[警告] 認証状態の確認に失敗しました。")
-        cursor_config_dir = Path.home() / '.cursor'
-        cursor_config_auth = Path.home() / '.config' / 'cursor' / 'auth.json'
-        if cursor_config_dir.exists() or cursor_config_auth.exists():
+        existing_auth_paths = [path for path, exists in cursor_auth_locations().items() if exists]
+        if existing_auth_paths:
             print(f"[情報] Cursor設定ディレクトリが存在します:")
-            if cursor_config_dir.exists():
-                print(f"  - {cursor_config_dir}")
-            if cursor_config_auth.exists():
-                print(f"  - {cursor_config_auth}")
+            for path in existing_auth_paths:
+                print(f"  - {path}")
             print("[情報] 認証済みの可能性があります。続行します...")
         else:
             authenticate_cursor()
 
+    # Heavy modules (LLM clients, agents) are imported only once the startup
+    # checks have passed, so early exits and the dashboard import stay cheap
+    from orchestragent.core.logger import AgentLogger
+    from orchestragent.llm.factory import LLMClientFactory
+    from orchestragent.state.manager import StateManager
+    from orchestragent.state.file_lock import FileLockManager
+    from orchestragent.scheduler.task_scheduler import TaskScheduler
+    from orchestragent.agents.base import BaseAgent
+    from orchestragent.agents.planner import PlannerAgent
+    from orchestragent.agents.worker import WorkerAgent
+    from orchestragent.agents.judge import JudgeAgent
+    from orchestragent.agents.plan_judge import PlanJudgeAgent
+
     # Initialize components
     print("\n[初期化] コンポーネントを初期化しています...")
 
+    # The LLM client and the logger do not depend on the state files: build them
+    # in the background while the state is validated / recovered below
+    init_executor = ThreadPoolExecutor(max_workers=2, thread_name_prefix="init")
     # Use WORKING_DIR which is already determined based on container/host environment
-    llm_client = LLMClientFactory.create(
+    llm_client_future = init_executor.submit(
+        LLMClientFactory.create,
         backend=config.LLM_BACKEND,
-        project_root=str(config.WORKING_DIR),
+        project_root=config.WORKING_DIR_STR,
         output_format=config.LLM_OUTPUT_FORMAT
     )
+    logger_future = init_executor.submit(
+        AgentLogger,
+        log_dir=config.LOG_DIR,
+        log_level=config.LOG_LEVEL,
+        sync=config.LOG_FSYNC,
+    )
+    init_executor.shutdown(wait=False)
 
     state_manager = StateManager(state_dir=config.STATE_DIR)
 
@@ -100,20 +167,19 @@ def run_main_loop() -> None:
         for task_id in recovered_tasks:
             print(f"  - {task_id}")
 
-    logger = AgentLogger(
-        log_dir=config.LOG_DIR,
-        log_level=config.LOG_LEVEL,
-        sync=config.LOG_FSYNC,
-    )
+    llm_client = llm_client_future.result()
+    logger = logger_future.result()
 
     # Initialize file lock manager and task scheduler for parallel execution
     file_lock_manager = FileLockManager(lock_dir=f"{config.STATE_DIR}/locks")
     task_scheduler = TaskScheduler(state_manager, file_lock_manager)
 
     # Initialize agents
-    planner_config = config.AGENT_CONFIG.copy()
-    planner_config["mode"] = "plan"
-    planner_config["model"] = config.PLANNER_MODEL
+    # Each agent layers its overrides over the shared read-only base config
+    planner_config = ChainMap(
+        {"mode": "plan", "model": config.PLANNER_MODEL},
+        config.AGENT_CONFIG,
+    )
 
     planner = PlannerAgent(
         name="Planner",
@@ -123,10 +189,10 @@ def run_main_loop() -> None:
         config=planner_config
     )
 
-    worker_config = config.AGENT_CONFIG.copy()
-    worker_config["mode"] = "agent"
-    worker_config["prompt_template"] = "prompts/worker.md"
-    worker_config["model"] = config.WORKER_MODEL
+    worker_config = ChainMap(
+        {"mode": "agent", "prompt_template": "prompts/worker.md", "model": config.WORKER_MODEL},
+        config.AGENT_CONFIG,
+    )
 
     worker = WorkerAgent(
         name="Worker",
@@ -136,10 +202,10 @@ def run_main_loop() -> None:
         config=worker_config
     )
 
-    judge_config = config.AGENT_CONFIG.copy()
-    judge_config["mode"] = "ask"
-    judge_config["prompt_template"] = "prompts/judge.md"
-    judge_config["model"] = config.JUDGE_MODEL
+    judge_config = ChainMap(
+        {"mode": "ask", "prompt_template": "prompts/judge.md", "model": config.JUDGE_MODEL},
+        config.AGENT_CONFIG,
+    )
 
     judge = JudgeAgent(
         name="Judge",
@@ -149,10 +215,10 @@ def run_main_loop() -> None:
         config=judge_config
     )
 
-    plan_judge_config = config.AGENT_CONFIG.copy()
-    plan_judge_config["mode"] = "ask"
-    plan_judge_config["prompt_template"] = "prompts/plan_judge.md"
-    plan_judge_config["model"] = config.JUDGE_MODEL
+    plan_judge_config = ChainMap(
+        {"mode": "ask", "prompt_template": "prompts/plan_judge.md", "model": config.JUDGE_MODEL},
+        config.AGENT_CONFIG,
+    )
 
     plan_judge = PlanJudgeAgent(
         name="Plan_Judge",
@@ -179,6 +245,15 @@ def run_main_loop() -> None:
     except Exception as e:
         logger.warning(f"Failed to create initial checkpoint: {e}")
 
+    # Per-iteration checkpoints are written in the background, overlapping the
+    # wait before the next iteration
+    snapshot_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="snapshot")
+    pending_snapshot = None
+    # Parallel Worker threads are kept across iterations (started on first use)
+    worker_executor = ThreadPoolExecutor(
+        max_workers=max(1, config.MAX_PARALLEL_WORKERS), thread_name_prefix="worker"
+    )
+
     try:
         while iteration < config.MAX_ITERATIONS:
             iteration += 1
@@ -186,6 +261,11 @@ def run_main_loop() -> None:
             print(f"イテレーション {iteration}")
             print(f"{'=' * 60}")
 
+            # The previous checkpoint must be complete before the state changes again
+            if pending_snapshot is not None:
+                pending_snapshot.result()
+                pending_snapshot = None
+
             # Update status with current iteration
             state_manager.update_status(current_iteration=iteration)
 
@@ -259,10 +339,13 @@ def run_main_loop() -> None:
             # 待機
             wait_seconds = config.WAIT_TIME_SECONDS
             print(f"\n[待機] {config.WAIT_TIME_SECONDS}秒待機中...")
-            time.sleep(wait_seconds)
+            if _wait_or_stop(wait_seconds):
+                print("\n[停止] 停止要求を受けたためメインループを終了します")
+                break
 
             # 2. Worker実行（並列実行対応）
             print("\n[2/3] Worker実行中...")
+            worker_ran = False
 
             if config.ENABLE_PARALLEL_EXECUTION:
                 # Parallel execution mode
@@ -274,6 +357,7 @@ def run_main_loop() -> None:
                     print("[Worker] 並列実行可能なタスクがありません")
                 else:
                     print(f"[Worker] {len(parallelizable_tasks)}個のタスクを並列実行します")
+                    worker_ran = True
 
                     def run_worker_task(task_data) -> Dict[str, Any]:
                         """Run a single worker task."""
@@ -283,7 +367,9 @@ def run_main_loop() -> None:
                             llm_client=llm_client,
                             state_manager=state_manager,
                             logger=logger,
-                            config=worker_config
+                            # Own layer: per-task model selection must not leak
+                            # into workers running concurrently
+                            config=worker_config.new_child()
                         )
 
                         result = {
@@ -341,36 +427,35 @@ def run_main_loop() -> None:
                         return result
 
                     # Execute tasks in parallel
-                    with ThreadPoolExecutor(max_workers=config.MAX_PARALLEL_WORKERS) as executor:
-                        future_to_task = {
-                            executor.submit(run_worker_task, task): task
-                            for task in parallelizable_tasks
-                        }
+                    future_to_task = {
+                        worker_executor.submit(run_worker_task, task): task
+                        for task in parallelizable_tasks
+                    }
 
-                        completed_count = 0
-                        failed_count = 0
-
-                        for future in as_completed(future_to_task):
-                            task = future_to_task[future]
-                            task_id = task.id
-                            try:
-                                result = future.result()
-                                if result["success"]:
-                                    completed_count += 1
-                                    print(f"[Worker] タスク {task_id} 完了: {task.title}")
-                                else:
-                                    failed_count += 1
-                                    print(f"[Worker] タスク {task_id} 失敗: {result.get('error', 'Unknown error')}")
-                            except Exception as e:
+                    completed_count = 0
+                    failed_count = 0
+
+                    for future in as_completed(future_to_task):
+                        task = future_to_task[future]
+                        task_id = task.id
+                        try:
+                            result = future.result()
+                            if result["success"]:
+                                completed_count += 1
+                                print(f"[Worker] タスク {task_id} 完了: {task.title}")
+                            else:
                                 failed_count += 1
-                                logger.log_error_with_traceback(
-                                    f"Worker-{task_id}",
-                                    e,
-                                    context={"iteration": iteration, "task_id": task_id}
-                                )
-                                print(f"[Worker] タスク {task_id} 例外: {e}")
+                                print(f"[Worker] タスク {task_id} 失敗: {result.get('error', 'Unknown error')}")
+                        except Exception as e:
+                            failed_count += 1
+                            logger.log_error_with_traceback(
+                                f"Worker-{task_id}",
+                                e,
+                                context={"iteration": iteration, "task_id": task_id}
+                            )
+                            print(f"[Worker] タスク {task_id} 例外: {e}")
 
-                        print(f"[Worker] 並列実行完了: {completed_count}成功, {failed_count}失敗")
+                    print(f"[Worker] 並列実行完了: {completed_count}成功, {failed_count}失敗")
 
                     # Cleanup stale locks
                     stale_locks = file_lock_manager.cleanup_stale_locks(timeout=300.0)
@@ -387,6 +472,7 @@ def run_main_loop() -> None:
                     task = pending_tasks[0]
                     task_id = task.id
                     print(f"[Worker] タスク {task_id} を実行: {task.title}")
+                    worker_ran = True
 
                     if worker.assign_task(task_id):
                         try:
@@ -412,9 +498,12 @@ def run_main_loop() -> None:
                     else:
                         print(f"[Worker] タスク {task_id} の割り当てに失敗")
 
-            # 待機
-            print(f"\n[待機] {config.WAIT_TIME_SECONDS}秒待機中...")
-            time.sleep(wait_seconds)
+            # 待機（Worker が何も実行しなかった場合は待つ必要がない）
+            if worker_ran:
+                print(f"\n[待機] {config.WAIT_TIME_SECONDS}秒待機中...")
+                if _wait_or_stop(wait_seconds):
+                    print("\n[停止] 停止要求を受けたためメインループを終了します")
+                    break
 
             # 3. Judge実行
             print("\n[3/3] Judge実行中...")
@@ -456,25 +545,21 @@ def run_main_loop() -> None:
                 print("\n[完了] Judgeが停止を判定しました")
                 break
 
-            # Create checkpoint after each iteration
-            try:
-                checkpoint_path = state_manager.create_checkpoint()
-                logger.info(f"Checkpoint created after iteration {iteration}: {checkpoint_path}")
-            except Exception as e:
-                logger.warning(f"Failed to create checkpoint: {e}")
-
-            # Create backup periodically (every 5 iterations)
-            if iteration % 5 == 0:
-                try:
-                    backup_path = state_manager.create_backup()
-                    logger.info(f"Backup created: {backup_path}")
-                except Exception as e:
-                    logger.warning(f"Failed to create backup: {e}")
+            # Create checkpoint (and periodic backup) in the background
+            pending_snapshot = snapshot_executor.submit(
+                _save_snapshots, state_manager, logger, iteration
+            )
 
             # 次のイテレーション前に待機
             if iteration < config.MAX_ITERATIONS:
                 print(f"\n[待機] 次のイテレーションまで {config.WAIT_TIME_SECONDS}秒待機中...")
-                time.sleep(wait_seconds)
+                if _wait_or_stop(wait_seconds):
+                    print("\n[停止] 停止要求を受けたためメインループを終了します")
+                    break
+
+        # Wait for the last checkpoint before reporting the final state
+        snapshot_executor.shutdown(wait=True)
+        worker_executor.shutdown(wait=True)
 
         if iteration >= config.MAX_ITERATIONS:
             print(f"\n[完了] 最大イテレーション数 ({config.MAX_ITERATIONS}) に達しました")
@@ -486,7 +571,6 @@ def run_main_loop() -> None:
 
         # Get accurate statistics from individual task files
         task_stats = state_manager.get_task_statistics()
-        status = state_manager.get_status()
 
         print(f"総イテレーション: {iteration}")
         print(f"総タスク数: {task_stats.total}")
@@ -494,10 +578,16 @@ def run_main_loop() -> None:
         print(f"失敗タスク: {task_stats.failed}")
         print(f"保留中タスク: {task_stats.pending}")
         print(f"実行中タスク: {task_stats.in_progress}")
+        if config.RESPONSE_CACHE_ENABLED:
+            cache_stats = BaseAgent.response_cache_stats()
+            print(f"レスポンスキャッシュ: ヒット {cache_stats['hits']} / ミス {cache_stats['misses']}")
+            logger.info(f"Response cache stats: {cache_stats}")
 
     except KeyboardInterrupt:
         print("\n\n[中断] ユーザーによって中断されました")
         logger.info("Main loop interrupted by user")
+        snapshot_executor.shutdown(wait=True)
+        worker_executor.shutdown(wait=True)
         # Release all file locks
         if config.ENABLE_PARALLEL_EXECUTION:
             file_lock_manager.release_all_locks()
@@ -510,6 +600,8 @@ def run_main_loop() -> None:
             logger.warning(f"Failed to create checkpoint before exit: {e}")
     except Exception as e:
         logger.log_error_with_traceback("MainLoop", e, context={"iteration": iteration})
+        snapshot_executor.shutdown(wait=True)
+        worker_executor.shutdown(wait=True)
         # Release all file locks
         if config.ENABLE_PARALLEL_EXECUTION:
             file_lock_manager.release_all_locks()
@@ -0,0 +1,42 @@
+"""Tests for the codebase summary shared by Planner and Plan_Judge."""
+
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "src"))
+
+from orchestragent.agents.codebase import get_codebase_summary
+
+
+def test_summary_lists_python_files(tmp_path):
+    (tmp_path / "main.py").write_text("")
+    (tmp_path / "README.md").write_text("")
+
+    summary = get_codebase_summary(str(tmp_path))
+
+    assert "- main.py" in summary
+    assert "README.md" not in summary
+
+
+def test_summary_changes_when_nested_file_is_added(tmp_path):
+    package = tmp_path / "src" / "pkg"
+    package.mkdir(parents=True)
+    (package / "__init__.py").write_text("")
+    before = get_codebase_summary(str(tmp_path))
+
+    (package / "new.py").write_text("")
+    after = get_codebase_summary(str(tmp_path))
+
+    assert after != before
+    assert "new.py" in after
+
+
+def test_summary_skips_ignored_directories(tmp_path):
+    (tmp_path / "__pycache__").mkdir()
+    (tmp_path / "__pycache__" / "cached.py").write_text("")
+    (tmp_path / "app.py").write_text("")
+
+    summary = get_codebase_summary(str(tmp_path))
+
+    assert "cached.py" not in summary
+    assert "- app.py" in summary
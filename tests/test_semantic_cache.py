@@ -0,0 +1,73 @@
+"""Tests for the similarity-based response cache."""
+
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "src"))
+
+from orchestragent.llm.semantic_cache import DEFAULT_THRESHOLDS, SemanticCache
+
+_JUDGE_STATE = """## 現在の状況
+
+### 現在の計画
+認証モジュールを実装し、ログイン画面からAPIまでを接続する。
+
+### タスクの状況
+- 総タスク数: {total}
+- 完了タスク: {completed}
+- 失敗タスク: 0
+- 保留中タスク: {pending}
+
+### 完了したタスクの結果
+(なし)
+
+### 現在のイテレーション
+{iteration}
+"""
+
+
+def _judge_state(total, completed, pending, iteration, timestamp="2026-01-01T00:00:00"):
+    return _JUDGE_STATE.format(
+        total=total, completed=completed, pending=pending, iteration=iteration
+    ) + f"\n最終更新: {timestamp}\n"
+
+
+def test_prompts_differing_only_in_task_counts_do_not_hit():
+    cache = SemanticCache()
+    cache.insert(_judge_state(4, 0, 4, 1), '{"should_continue": true}', namespace="judge")
+
+    hit = cache.lookup(_judge_state(4, 2, 2, 1), DEFAULT_THRESHOLDS["ask"], namespace="judge")
+
+    assert hit is None
+
+
+def test_prompts_differing_only_in_iteration_do_not_hit():
+    cache = SemanticCache()
+    cache.insert(_judge_state(4, 2, 2, 1), '{"should_continue": true}', namespace="judge")
+
+    hit = cache.lookup(_judge_state(4, 2, 2, 2), DEFAULT_THRESHOLDS["ask"], namespace="judge")
+
+    assert hit is None
+
+
+def test_prompts_differing_only_in_timestamp_hit():
+    cache = SemanticCache()
+    cache.insert(_judge_state(4, 2, 2, 1), '{"should_continue": true}', namespace="judge")
+
+    hit = cache.lookup(
+        _judge_state(4, 2, 2, 1, timestamp="2026-01-01T00:05:00"),
+        DEFAULT_THRESHOLDS["ask"],
+        namespace="judge",
+    )
+
+    assert hit is not None
+    assert hit[0] == '{"should_continue": true}'
+
+
+def test_namespaces_are_isolated():
+    cache = SemanticCache()
+    cache.insert(_judge_state(4, 2, 2, 1), '{"should_continue": true}', namespace="judge")
+
+    hit = cache.lookup(_judge_state(4, 2, 2, 1), DEFAULT_THRESHOLDS["ask"], namespace="plan_judge")
+
+    assert hit is None